@@ -3,11 +3,12 @@ import logging
 import os
 import shutil
 import base64
+import copy
 import redis
 
 from datetime import datetime
 from pathlib import Path
-from typing import Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 from urllib.parse import urlparse
 
 import requests
@@ -29,7 +30,7 @@ from open_webui.env import (
     WEBUI_NAME,
     log,
 )
-from open_webui.internal.db import Base, get_db
+from open_webui.internal.db import Base, engine, get_db
 from open_webui.utils.redis import get_redis_connection
 
 
@@ -63,6 +64,15 @@ def run_migrations():
     except Exception as e:
         log.exception(f"Error running migrations: {e}")
 
+    # Refresh the planner statistics once per startup so new indexes are used.
+    # Not repeated per request: re-analyzing invalidates cached statement plans.
+    if engine.dialect.name == "sqlite":
+        try:
+            with engine.begin() as conn:
+                conn.exec_driver_sql("PRAGMA optimize=0x10002")
+        except Exception as e:
+            log.warning(f"Failed to optimize the database: {e}")
+
 
 run_migrations()
 
@@ -211,11 +221,13 @@ class PersistentConfig(Generic[T]):
 class AppConfig:
     _state: dict[str, PersistentConfig]
     _redis: Optional[redis.Redis] = None
+    _redis_cache: dict[str, tuple[str, Any]]
 
     def __init__(
         self, redis_url: Optional[str] = None, redis_sentinels: Optional[list] = []
     ):
         super().__setattr__("_state", {})
+        super().__setattr__("_redis_cache", {})
         if redis_url:
             super().__setattr__(
                 "_redis",
@@ -244,11 +256,18 @@ class AppConfig:
 
             if redis_value is not None:
                 try:
-                    decoded_value = json.loads(redis_value)
-
-                    # Update the in-memory value if different
+                    # Only decode when the stored JSON changed since the last read
+                    cached = self._redis_cache.get(key)
+                    if cached is not None and cached[0] == redis_value:
+                        decoded_value = cached[1]
+                    else:
+                        decoded_value = json.loads(redis_value)
+                        self._redis_cache[key] = (redis_value, decoded_value)
+
+                    # Update the in-memory value if different; copy it so callers
+                    # mutating the config value can't alter the cached decode
                     if self._state[key].value != decoded_value:
-                        self._state[key].value = decoded_value
+                        self._state[key].value = copy.deepcopy(decoded_value)
                         log.info(f"Updated {key} from Redis: {decoded_value}")
 
                 except json.JSONDecodeError:
@@ -640,14 +659,14 @@ load_oauth_providers()
 
 STATIC_DIR = Path(os.getenv("STATIC_DIR", OPEN_WEBUI_DIR / "static")).resolve()
 
-for file_path in (FRONTEND_BUILD_DIR / "static").glob("**/*"):
-    if file_path.is_file():
-        target_path = STATIC_DIR / file_path.relative_to(
-            (FRONTEND_BUILD_DIR / "static")
-        )
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+# os.walk classifies entries from the directory listing instead of a stat per path
+for dir_path, _, file_names in os.walk(FRONTEND_BUILD_DIR / "static"):
+    target_dir = STATIC_DIR / Path(dir_path).relative_to(FRONTEND_BUILD_DIR / "static")
+    if file_names:
+        target_dir.mkdir(parents=True, exist_ok=True)
+    for file_name in file_names:
         try:
-            shutil.copyfile(file_path, target_path)
+            shutil.copyfile(os.path.join(dir_path, file_name), target_dir / file_name)
         except Exception as e:
             logging.error(f"An error occurred: {e}")
 
@@ -2124,6 +2143,13 @@ PDF_EXTRACT_IMAGES = PersistentConfig(
     os.environ.get("PDF_EXTRACT_IMAGES", "False").lower() == "true",
 )
 
+# "pypdf" (default) or "pymupdf", which is faster but needs PyMuPDF installed
+PDF_LOADER = PersistentConfig(
+    "PDF_LOADER",
+    "rag.pdf_loader",
+    os.environ.get("PDF_LOADER", "pypdf").lower(),
+)
+
 RAG_EMBEDDING_MODEL = PersistentConfig(
     "RAG_EMBEDDING_MODEL",
     "rag.embedding_model",
@@ -1,4 +1,5 @@
 import importlib.metadata
+import importlib.util
 import json
 import logging
 import os
@@ -8,8 +9,6 @@ import shutil
 from uuid import uuid4
 from pathlib import Path
 
-import markdown
-from bs4 import BeautifulSoup
 from open_webui.constants import ERROR_MESSAGES
 
 ####################################
@@ -54,13 +53,15 @@ if USE_CUDA.lower() == "true":
 else:
     DEVICE_TYPE = "cpu"
 
-try:
-    import torch
+# MPS only exists on macOS; avoid importing torch at startup anywhere else
+if sys.platform == "darwin" and importlib.util.find_spec("torch") is not None:
+    try:
+        import torch
 
-    if torch.backends.mps.is_available() and torch.backends.mps.is_built():
-        DEVICE_TYPE = "mps"
-except Exception:
-    pass
+        if torch.backends.mps.is_available() and torch.backends.mps.is_built():
+            DEVICE_TYPE = "mps"
+    except Exception:
+        pass
 
 ####################################
 # LOGGING
@@ -153,45 +154,67 @@ def parse_section(section):
     return items
 
 
-try:
-    changelog_path = BASE_DIR / "CHANGELOG.md"
-    with open(str(changelog_path.absolute()), "r", encoding="utf8") as file:
-        changelog_content = file.read()
+def parse_changelog() -> dict:
+    import markdown
+    from bs4 import BeautifulSoup
 
-except Exception:
-    changelog_content = (pkgutil.get_data("open_webui", "CHANGELOG.md") or b"").decode()
+    try:
+        changelog_path = BASE_DIR / "CHANGELOG.md"
+        with open(str(changelog_path.absolute()), "r", encoding="utf8") as file:
+            changelog_content = file.read()
 
-# Convert markdown content to HTML
-html_content = markdown.markdown(changelog_content)
+    except Exception:
+        changelog_content = (
+            pkgutil.get_data("open_webui", "CHANGELOG.md") or b""
+        ).decode()
+
+    # Convert markdown content to HTML
+    html_content = markdown.markdown(changelog_content)
+
+    # Parse the HTML content
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    # Initialize JSON structure
+    changelog_json = {}
 
-# Parse the HTML content
-soup = BeautifulSoup(html_content, "html.parser")
+    # Iterate over each version
+    for version in soup.find_all("h2"):
+        # Remove brackets
+        version_number = version.get_text().strip().split(" - ")[0][1:-1]
+        date = version.get_text().strip().split(" - ")[1]
 
-# Initialize JSON structure
-changelog_json = {}
+        version_data = {"date": date}
 
-# Iterate over each version
-for version in soup.find_all("h2"):
-    version_number = version.get_text().strip().split(" - ")[0][1:-1]  # Remove brackets
-    date = version.get_text().strip().split(" - ")[1]
+        # Find the next sibling that is a h3 tag (section title)
+        current = version.find_next_sibling()
 
-    version_data = {"date": date}
+        while current and current.name != "h2":
+            if current.name == "h3":
+                section_title = current.get_text().lower()  # e.g., "added", "fixed"
+                section_items = parse_section(current.find_next_sibling("ul"))
+                version_data[section_title] = section_items
 
-    # Find the next sibling that is a h3 tag (section title)
-    current = version.find_next_sibling()
+            # Move to the next element
+            current = current.find_next_sibling()
 
-    while current and current.name != "h2":
-        if current.name == "h3":
-            section_title = current.get_text().lower()  # e.g., "added", "fixed"
-            section_items = parse_section(current.find_next_sibling("ul"))
-            version_data[section_title] = section_items
+        changelog_json[version_number] = version_data
 
-        # Move to the next element
-        current = current.find_next_sibling()
+    return changelog_json
 
-    changelog_json[version_number] = version_data
 
-CHANGELOG = changelog_json
+_changelog = None
+
+
+def __getattr__(name):
+    # The changelog is only served by one endpoint, so parse it on first access
+    # rather than on every import of this module
+    global _changelog
+    if name == "CHANGELOG":
+        if _changelog is None:
+            _changelog = parse_changelog()
+        return _changelog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 ####################################
 # SAFE_MODE
@@ -312,6 +335,31 @@ else:
     except Exception:
         DATABASE_POOL_RECYCLE = 3600
 
+DATABASE_ENABLE_SQLITE_WAL = (
+    os.environ.get("DATABASE_ENABLE_SQLITE_WAL", "True").lower() == "true"
+)
+
+DATABASE_SQLITE_MMAP_SIZE = os.environ.get("DATABASE_SQLITE_MMAP_SIZE", 268435456)
+
+if DATABASE_SQLITE_MMAP_SIZE == "":
+    DATABASE_SQLITE_MMAP_SIZE = 268435456
+else:
+    try:
+        DATABASE_SQLITE_MMAP_SIZE = int(DATABASE_SQLITE_MMAP_SIZE)
+    except Exception:
+        DATABASE_SQLITE_MMAP_SIZE = 268435456
+
+# Negative values are in KiB, matching PRAGMA cache_size
+DATABASE_SQLITE_CACHE_SIZE = os.environ.get("DATABASE_SQLITE_CACHE_SIZE", -64000)
+
+if DATABASE_SQLITE_CACHE_SIZE == "":
+    DATABASE_SQLITE_CACHE_SIZE = -64000
+else:
+    try:
+        DATABASE_SQLITE_CACHE_SIZE = int(DATABASE_SQLITE_CACHE_SIZE)
+    except Exception:
+        DATABASE_SQLITE_CACHE_SIZE = -64000
+
 RESET_CONFIG_ON_START = (
     os.environ.get("RESET_CONFIG_ON_START", "False").lower() == "true"
 )
@@ -424,6 +472,16 @@ AIOHTTP_CLIENT_SESSION_SSL = (
     os.environ.get("AIOHTTP_CLIENT_SESSION_SSL", "True").lower() == "true"
 )
 
+# Maximum simultaneous connections held by the shared chat completion session.
+# Defaults to 0 (unlimited) so concurrent streams are never queued behind the
+# pool; set a positive value to cap outbound connections to the providers.
+AIOHTTP_CLIENT_CONNECTION_LIMIT = os.environ.get("AIOHTTP_CLIENT_CONNECTION_LIMIT", "0")
+
+try:
+    AIOHTTP_CLIENT_CONNECTION_LIMIT = max(int(AIOHTTP_CLIENT_CONNECTION_LIMIT), 0)
+except Exception:
+    AIOHTTP_CLIENT_CONNECTION_LIMIT = 0
+
 AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST = os.environ.get(
     "AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST",
     os.environ.get("AIOHTTP_CLIENT_TIMEOUT_OPENAI_MODEL_LIST", "10"),
@@ -519,6 +577,12 @@ if OFFLINE_MODE:
 AUDIT_LOGS_FILE_PATH = f"{DATA_DIR}/audit.log"
 # Maximum size of a file before rotating into a new log file
 AUDIT_LOG_FILE_ROTATION_SIZE = os.getenv("AUDIT_LOG_FILE_ROTATION_SIZE", "10MB")
+# Bytes of audit entries to buffer before writing to the log file. Defaults to line
+# buffering (1) so no entry is lost on a crash; larger buffers are an explicit opt-in
+try:
+    AUDIT_LOG_FILE_BUFFER_SIZE = int(os.environ.get("AUDIT_LOG_FILE_BUFFER_SIZE") or 1)
+except ValueError:
+    AUDIT_LOG_FILE_BUFFER_SIZE = 1
 # METADATA | REQUEST | REQUEST_RESPONSE
 AUDIT_LOG_LEVEL = os.getenv("AUDIT_LOG_LEVEL", "NONE").upper()
 try:
@@ -13,9 +13,12 @@ from open_webui.env import (
     DATABASE_POOL_RECYCLE,
     DATABASE_POOL_SIZE,
     DATABASE_POOL_TIMEOUT,
+    DATABASE_ENABLE_SQLITE_WAL,
+    DATABASE_SQLITE_CACHE_SIZE,
+    DATABASE_SQLITE_MMAP_SIZE,
 )
 from peewee_migrate import Router
-from sqlalchemy import Dialect, create_engine, MetaData, types
+from sqlalchemy import Dialect, create_engine, event, make_url, MetaData, types
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import QueuePool, NullPool
@@ -75,11 +78,44 @@ def handle_peewee_migration(DATABASE_URL):
 handle_peewee_migration(DATABASE_URL)
 
 
+def is_sqlite_in_memory(url: str) -> bool:
+    database = make_url(url).database
+    return not database or database == ":memory:" or "mode=memory" in url
+
+
 SQLALCHEMY_DATABASE_URL = DATABASE_URL
-if "sqlite" in SQLALCHEMY_DATABASE_URL:
+if "sqlite" in SQLALCHEMY_DATABASE_URL and is_sqlite_in_memory(SQLALCHEMY_DATABASE_URL):
+    # In-memory databases live per connection, so keep SQLAlchemy's default pool
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
     )
+elif "sqlite" in SQLALCHEMY_DATABASE_URL:
+    # Pool connections so the pragmas and page cache persist across sessions, and
+    # keep enough prepared statements per connection to cover the ORM's queries.
+    # LIFO checkout keeps reusing the most recently used, warmest connections.
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False, "cached_statements": 512},
+        poolclass=QueuePool,
+        pool_size=DATABASE_POOL_SIZE if DATABASE_POOL_SIZE > 0 else 5,
+        max_overflow=DATABASE_POOL_MAX_OVERFLOW if DATABASE_POOL_SIZE > 0 else 10,
+        pool_timeout=DATABASE_POOL_TIMEOUT,
+        pool_use_lifo=True,
+    )
+
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # WAL lets readers proceed during writes and only fsyncs on checkpoint
+        if DATABASE_ENABLE_SQLITE_WAL:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        # Serve reads from mapped pages and a larger page cache
+        cursor.execute(f"PRAGMA mmap_size={DATABASE_SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size={DATABASE_SQLITE_CACHE_SIZE}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    event.listen(engine, "connect", on_connect)
 else:
     if DATABASE_POOL_SIZE > 0:
         engine = create_engine(
@@ -12,6 +12,7 @@ from uuid import uuid4
 
 
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from urllib.parse import urlencode, parse_qs, urlparse
 from pydantic import BaseModel
 from sqlalchemy import text
@@ -243,6 +244,7 @@ from open_webui.config import (
     RAG_TEXT_SPLITTER,
     TIKTOKEN_ENCODING_NAME,
     PDF_EXTRACT_IMAGES,
+    PDF_LOADER,
     YOUTUBE_LOADER_LANGUAGE,
     YOUTUBE_LOADER_PROXY_URL,
     # Retrieval (Web Search)
@@ -385,7 +387,6 @@ from open_webui.config import (
 from open_webui.env import (
     AUDIT_EXCLUDED_PATHS,
     AUDIT_LOG_LEVEL,
-    CHANGELOG,
     REDIS_URL,
     REDIS_SENTINEL_HOSTS,
     REDIS_SENTINEL_PORT,
@@ -529,6 +530,8 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "redis_task_command_listener"):
         app.state.redis_task_command_listener.cancel()
 
+    await openai.close_chat_completion_session()
+
 
 app = FastAPI(
     title="Open WebUI",
@@ -765,6 +768,7 @@ app.state.config.RAG_OLLAMA_BASE_URL = RAG_OLLAMA_BASE_URL
 app.state.config.RAG_OLLAMA_API_KEY = RAG_OLLAMA_API_KEY
 
 app.state.config.PDF_EXTRACT_IMAGES = PDF_EXTRACT_IMAGES
+app.state.config.PDF_LOADER = PDF_LOADER
 
 app.state.config.YOUTUBE_LOADER_LANGUAGE = YOUTUBE_LOADER_LANGUAGE
 app.state.config.YOUTUBE_LOADER_PROXY_URL = YOUTUBE_LOADER_PROXY_URL
@@ -1170,6 +1174,14 @@ if audit_level != AuditLevel.NONE:
 @app.get("/api/models")
 async def get_models(request: Request, user=Depends(get_verified_user)):
     def get_filtered_models(models, user):
+        # Fetch the access info for every listed model in one query
+        model_infos = {
+            model_info.id: model_info
+            for model_info in Models.get_models_by_ids(
+                [model["id"] for model in models if not model.get("arena")]
+            )
+        }
+
         filtered_models = []
         for model in models:
             if model.get("arena"):
@@ -1183,7 +1195,7 @@ async def get_models(request: Request, user=Depends(get_verified_user)):
                     filtered_models.append(model)
                 continue
 
-            model_info = Models.get_model_by_id(model["id"])
+            model_info = model_infos.get(model["id"])
             if model_info:
                 if user.id == model_info.user_id or has_access(
                     user.id, type="read", access_control=model_info.access_control
@@ -1613,9 +1625,21 @@ async def get_app_latest_release_version(user=Depends(get_verified_user)):
         return {"current": VERSION, "latest": VERSION}
 
 
+# The changelog is static, so parse and encode the latest entries on first request
+@lru_cache
+def get_changelog_response_body() -> bytes:
+    from open_webui.env import CHANGELOG
+
+    return JSONResponse(
+        {key: CHANGELOG[key] for idx, key in enumerate(CHANGELOG) if idx < 5}
+    ).body
+
+
 @app.get("/api/changelog")
 async def get_app_changelog():
-    return {key: CHANGELOG[key] for idx, key in enumerate(CHANGELOG) if idx < 5}
+    return Response(
+        content=get_changelog_response_body(), media_type="application/json"
+    )
 
 
 ############################
@@ -0,0 +1,46 @@
+"""Add indexes for chat and message lookups
+
+Revision ID: ad6bea7516ce
+Revises: 9f0c9cd09105
+Create Date: 2026-10-15 03:00:00.000000
+
+"""
+
+from alembic import op
+
+revision = "ad6bea7516ce"
+down_revision = "9f0c9cd09105"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Chat lists filter by owner and archived/pinned/folder and sort by updated_at
+    op.create_index("chat_user_id_archived_idx", "chat", ["user_id", "archived"])
+    op.create_index("chat_user_id_pinned_idx", "chat", ["user_id", "pinned"])
+    op.create_index("chat_folder_id_user_id_idx", "chat", ["folder_id", "user_id"])
+    op.create_index("chat_user_id_updated_at_idx", "chat", ["user_id", "updated_at"])
+
+    # Channel messages and thread replies are listed newest first
+    op.create_index(
+        "message_channel_id_parent_id_created_at_idx",
+        "message",
+        ["channel_id", "parent_id", "created_at"],
+    )
+    op.create_index(
+        "message_parent_id_created_at_idx", "message", ["parent_id", "created_at"]
+    )
+
+    op.create_index(
+        "message_reaction_message_id_idx", "message_reaction", ["message_id"]
+    )
+
+
+def downgrade():
+    op.drop_index("message_reaction_message_id_idx", table_name="message_reaction")
+    op.drop_index("message_parent_id_created_at_idx", table_name="message")
+    op.drop_index("message_channel_id_parent_id_created_at_idx", table_name="message")
+    op.drop_index("chat_user_id_updated_at_idx", table_name="chat")
+    op.drop_index("chat_folder_id_user_id_idx", table_name="chat")
+    op.drop_index("chat_user_id_pinned_idx", table_name="chat")
+    op.drop_index("chat_user_id_archived_idx", table_name="chat")
@@ -0,0 +1,31 @@
+"""Add user_id indexes for per-user listings
+
+Revision ID: d31026856c01
+Revises: ad6bea7516ce
+Create Date: 2026-10-15 04:00:00.000000
+
+"""
+
+from alembic import op
+
+revision = "d31026856c01"
+down_revision = "ad6bea7516ce"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Files, memories, feedback and folders are all listed per user
+    op.create_index("file_user_id_idx", "file", ["user_id"])
+    op.create_index("memory_user_id_idx", "memory", ["user_id"])
+    op.create_index(
+        "feedback_user_id_updated_at_idx", "feedback", ["user_id", "updated_at"]
+    )
+    op.create_index("folder_user_id_parent_id_idx", "folder", ["user_id", "parent_id"])
+
+
+def downgrade():
+    op.drop_index("folder_user_id_parent_id_idx", table_name="folder")
+    op.drop_index("feedback_user_id_updated_at_idx", table_name="feedback")
+    op.drop_index("memory_user_id_idx", table_name="memory")
+    op.drop_index("file_user_id_idx", table_name="file")
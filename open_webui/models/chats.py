@@ -9,8 +9,8 @@ from open_webui.models.tags import TagModel, Tag, Tags
 from open_webui.env import SRC_LOG_LEVELS
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Boolean, Column, String, Text, JSON
-from sqlalchemy import or_, func, select, and_, text
+from sqlalchemy import BigInteger, Boolean, Column, Index, String, Text, JSON
+from sqlalchemy import or_, func, select, and_, text, true
 from sqlalchemy.sql import exists
 
 ####################
@@ -39,6 +39,13 @@ class Chat(Base):
     meta = Column(JSON, server_default="{}")
     folder_id = Column(Text, nullable=True)
 
+    __table_args__ = (
+        Index("chat_user_id_archived_idx", "user_id", "archived"),
+        Index("chat_user_id_pinned_idx", "user_id", "pinned"),
+        Index("chat_folder_id_user_id_idx", "folder_id", "user_id"),
+        Index("chat_user_id_updated_at_idx", "user_id", "updated_at"),
+    )
+
 
 class ChatModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -59,6 +66,76 @@ class ChatModel(BaseModel):
     folder_id: Optional[str] = None
 
 
+# Raw SQL used by chat search, built once per dialect rather than per query
+CHAT_MESSAGE_SEARCH_CLAUSES = {
+    # SQLite case: using JSON1 extension for JSON searching
+    "sqlite": text(
+        """
+        EXISTS (
+            SELECT 1
+            FROM json_each(Chat.chat, '$.messages') AS message
+            WHERE LOWER(message.value->>'content') LIKE '%' || :search_text || '%'
+        )
+        """
+    ),
+    # PostgreSQL relies on proper JSON query for search
+    "postgresql": text(
+        """
+        EXISTS (
+            SELECT 1
+            FROM json_array_elements(Chat.chat->'messages') AS message
+            WHERE LOWER(message->>'content') LIKE '%' || :search_text || '%'
+        )
+        """
+    ),
+}
+
+CHAT_UNTAGGED_CLAUSES = {
+    "sqlite": text(
+        """
+        NOT EXISTS (
+            SELECT 1
+            FROM json_each(Chat.meta, '$.tags') AS tag
+        )
+        """
+    ),
+    "postgresql": text(
+        """
+        NOT EXISTS (
+            SELECT 1
+            FROM json_array_elements_text(Chat.meta->'tags') AS tag
+        )
+        """
+    ),
+}
+
+# Chats carrying every tag in the :tag_ids JSON array, one statement for any count
+CHAT_TAGGED_CLAUSES = {
+    "sqlite": text(
+        """
+        NOT EXISTS (
+            SELECT 1
+            FROM json_each(:tag_ids) AS wanted
+            WHERE wanted.value NOT IN (
+                SELECT tag.value FROM json_each(Chat.meta, '$.tags') AS tag
+            )
+        )
+        """
+    ),
+    "postgresql": text(
+        """
+        NOT EXISTS (
+            SELECT 1
+            FROM json_array_elements_text(CAST(:tag_ids AS json)) AS wanted
+            WHERE wanted NOT IN (
+                SELECT tag FROM json_array_elements_text(Chat.meta->'tags') AS tag
+            )
+        )
+        """
+    ),
+}
+
+
 ####################
 # Forms
 ####################
@@ -203,11 +280,16 @@ class ChatTable:
         return self.get_chat_by_id(id)
 
     def get_chat_title_by_id(self, id: str) -> Optional[str]:
-        chat = self.get_chat_by_id(id)
-        if chat is None:
-            return None
+        # Extract the title in SQL instead of loading and validating the whole chat
+        try:
+            with get_db() as db:
+                row = db.query(Chat.chat["title"].as_string()).filter_by(id=id).first()
+                if row is None:
+                    return None
 
-        return chat.chat.get("title", "New Chat")
+                return row[0] if row[0] is not None else "New Chat"
+        except Exception:
+            return None
 
     def get_messages_by_chat_id(self, id: str) -> Optional[dict]:
         chat = self.get_chat_by_id(id)
@@ -236,10 +318,8 @@ class ChatTable:
         history = chat.get("history", {})
 
         if message_id in history.get("messages", {}):
-            history["messages"][message_id] = {
-                **history["messages"][message_id],
-                **message,
-            }
+            # Only the changed fields are written, the stored message is not copied
+            history["messages"][message_id].update(message)
         else:
             history["messages"][message_id] = message
 
@@ -539,6 +619,8 @@ class ChatTable:
                 db.query(Chat)
                 # .limit(limit).offset(skip)
                 .order_by(Chat.updated_at.desc())
+                # Stream rows in batches so the full export is never held as ORM rows
+                .yield_per(1000)
             )
             return [ChatModel.model_validate(chat) for chat in all_chats]
 
@@ -576,22 +658,18 @@ class ChatTable:
         include_archived: bool = False,
         skip: int = 0,
         limit: int = 60,
-    ) -> list[ChatModel]:
+    ) -> list[ChatTitleIdResponse]:
         """
         Filters chats based on a search query using Python, allowing pagination using skip and limit.
+        Only the title/id columns are selected so the chat JSON of every match is never loaded.
         """
         search_text = search_text.lower().strip()
 
-        if not search_text:
-            return self.get_chat_list_by_user_id(
-                user_id, include_archived, filter={}, skip=skip, limit=limit
-            )
-
         search_text_words = search_text.split(" ")
 
         # search_text might contain 'tag:tag_name' format so we need to extract the tag_name, split the search_text and remove the tags
         tag_ids = [
-            word.replace("tag:", "").replace(" ", "_").lower()
+            word.replace("tag:", "").replace(" ", "_")
             for word in search_text_words
             if word.startswith("tag:")
         ]
@@ -609,118 +687,87 @@ class ChatTable:
                 query = query.filter(Chat.archived == False)
 
             query = query.order_by(Chat.updated_at.desc())
+            search_pattern = f"%{search_text}%"
 
             # Check if the database dialect is either 'sqlite' or 'postgresql'
             dialect_name = db.bind.dialect.name
-            if dialect_name == "sqlite":
-                # SQLite case: using JSON1 extension for JSON searching
-                query = query.filter(
-                    (
-                        Chat.title.ilike(
-                            f"%{search_text}%"
-                        )  # Case-insensitive search in title
-                        | text(
-                            """
-                            EXISTS (
-                                SELECT 1 
-                                FROM json_each(Chat.chat, '$.messages') AS message 
-                                WHERE LOWER(message.value->>'content') LIKE '%' || :search_text || '%'
-                            )
-                            """
-                        )
-                    ).params(search_text=search_text)
-                )
 
-                # Check if there are any tags to filter, it should have all the tags
-                if "none" in tag_ids:
-                    query = query.filter(
-                        text(
-                            """
-                            NOT EXISTS (
-                                SELECT 1
-                                FROM json_each(Chat.meta, '$.tags') AS tag
-                            )
-                            """
-                        )
-                    )
-                elif tag_ids:
-                    query = query.filter(
-                        and_(
-                            *[
-                                text(
-                                    f"""
-                                    EXISTS (
-                                        SELECT 1
-                                        FROM json_each(Chat.meta, '$.tags') AS tag
-                                        WHERE tag.value = :tag_id_{tag_idx}
-                                    )
-                                    """
-                                ).params(**{f"tag_id_{tag_idx}": tag_id})
-                                for tag_idx, tag_id in enumerate(tag_ids)
-                            ]
-                        )
-                    )
+            # The search text is already lowercase. SQLite's LIKE folds ASCII case
+            # exactly as its LOWER() does, so match directly instead of lowercasing
+            # every title and chat; PostgreSQL needs ILIKE.
+            if dialect_name == "sqlite":
+                title_filter = Chat.title.like(search_pattern)
+                chat_filter = Chat.chat.cast(Text).like(search_pattern)
+            else:
+                title_filter = Chat.title.ilike(search_pattern)
+                chat_filter = Chat.chat.cast(Text).ilike(search_pattern)
+
+            # A message can only contain the search text if the serialized chat does,
+            # so a plain LIKE over the raw JSON discards most rows before their
+            # messages are expanded. JSON escapes quotes, backslashes and non-ASCII
+            # characters, so only text that is stored verbatim can take this path.
+            if (
+                search_text.isascii()
+                and search_text.isprintable()
+                and '"' not in search_text
+                and "\\" not in search_text
+            ):
+                message_prefilter = chat_filter
+            else:
+                message_prefilter = true()
 
-            elif dialect_name == "postgresql":
-                # PostgreSQL relies on proper JSON query for search
+            if not search_text and not tag_ids:
+                # Nothing to filter on, list the most recently updated chats
+                pass
+            elif dialect_name not in CHAT_MESSAGE_SEARCH_CLAUSES:
+                raise NotImplementedError(
+                    f"Unsupported dialect: {db.bind.dialect.name}"
+                )
+            else:
                 query = query.filter(
                     (
-                        Chat.title.ilike(
-                            f"%{search_text}%"
-                        )  # Case-insensitive search in title
-                        | text(
-                            """
-                            EXISTS (
-                                SELECT 1
-                                FROM json_array_elements(Chat.chat->'messages') AS message
-                                WHERE LOWER(message->>'content') LIKE '%' || :search_text || '%'
-                            )
-                            """
+                        title_filter  # Case-insensitive search in title
+                        | and_(
+                            message_prefilter,
+                            CHAT_MESSAGE_SEARCH_CLAUSES[dialect_name],
                         )
                     ).params(search_text=search_text)
                 )
 
                 # Check if there are any tags to filter, it should have all the tags
                 if "none" in tag_ids:
-                    query = query.filter(
-                        text(
-                            """
-                            NOT EXISTS (
-                                SELECT 1
-                                FROM json_array_elements_text(Chat.meta->'tags') AS tag
-                            )
-                            """
-                        )
-                    )
+                    query = query.filter(CHAT_UNTAGGED_CLAUSES[dialect_name])
                 elif tag_ids:
                     query = query.filter(
-                        and_(
-                            *[
-                                text(
-                                    f"""
-                                    EXISTS (
-                                        SELECT 1
-                                        FROM json_array_elements_text(Chat.meta->'tags') AS tag
-                                        WHERE tag = :tag_id_{tag_idx}
-                                    )
-                                    """
-                                ).params(**{f"tag_id_{tag_idx}": tag_id})
-                                for tag_idx, tag_id in enumerate(tag_ids)
-                            ]
+                        CHAT_TAGGED_CLAUSES[dialect_name].params(
+                            tag_ids=json.dumps(tag_ids)
                         )
                     )
-            else:
-                raise NotImplementedError(
-                    f"Unsupported dialect: {db.bind.dialect.name}"
-                )
 
             # Perform pagination at the SQL level
-            all_chats = query.offset(skip).limit(limit).all()
+            all_chats = (
+                query.with_entities(
+                    Chat.id, Chat.title, Chat.updated_at, Chat.created_at
+                )
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
 
             log.info(f"The number of chats: {len(all_chats)}")
 
             # Validate and return chats
-            return [ChatModel.model_validate(chat) for chat in all_chats]
+            return [
+                ChatTitleIdResponse.model_validate(
+                    {
+                        "id": chat[0],
+                        "title": chat[1],
+                        "updated_at": chat[2],
+                        "created_at": chat[3],
+                    }
+                )
+                for chat in all_chats
+            ]
 
     def get_chats_by_folder_id_and_user_id(
         self, folder_id: str, user_id: str
@@ -853,8 +900,8 @@ class ChatTable:
                     f"Unsupported dialect: {db.bind.dialect.name}"
                 )
 
-            # Get the count of matching records
-            count = query.count()
+            # Count in the outer query instead of over a subquery of full chat rows
+            count = query.with_entities(func.count(Chat.id)).scalar()
 
             # Debugging output for inspection
             log.info(f"Count of chats for tag '{tag_name}': {count}")
@@ -941,7 +988,9 @@ class ChatTable:
     def delete_shared_chats_by_user_id(self, user_id: str) -> bool:
         try:
             with get_db() as db:
-                chats_by_user = db.query(Chat).filter_by(user_id=user_id).all()
+                chats_by_user = (
+                    db.query(Chat).filter_by(user_id=user_id).with_entities(Chat.id)
+                )
                 shared_chat_ids = [f"shared-{chat.id}" for chat in chats_by_user]
 
                 db.query(Chat).filter(Chat.user_id.in_(shared_chat_ids)).delete()
@@ -8,7 +8,7 @@ from open_webui.models.chats import Chats
 
 from open_webui.env import SRC_LOG_LEVELS
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Column, Text, JSON, Boolean
+from sqlalchemy import BigInteger, Column, Index, Text, JSON, Boolean
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
@@ -31,6 +31,10 @@ class Feedback(Base):
     created_at = Column(BigInteger)
     updated_at = Column(BigInteger)
 
+    __table_args__ = (
+        Index("feedback_user_id_updated_at_idx", "user_id", "updated_at"),
+    )
+
 
 class FeedbackModel(BaseModel):
     id: str
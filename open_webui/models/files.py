@@ -5,7 +5,7 @@ from typing import Optional
 from open_webui.internal.db import Base, JSONField, get_db
 from open_webui.env import SRC_LOG_LEVELS
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Column, String, Text, JSON
+from sqlalchemy import BigInteger, Column, Index, String, Text, JSON
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
@@ -32,6 +32,8 @@ class File(Base):
     created_at = Column(BigInteger)
     updated_at = Column(BigInteger)
 
+    __table_args__ = (Index("file_user_id_idx", "user_id"),)
+
 
 class FileModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -133,7 +135,11 @@ class FilesTable:
     def get_file_metadata_by_id(self, id: str) -> Optional[FileMetadataResponse]:
         with get_db() as db:
             try:
-                file = db.get(File, id)
+                file = (
+                    db.query(File.id, File.meta, File.created_at, File.updated_at)
+                    .filter_by(id=id)
+                    .first()
+                )
                 return FileMetadataResponse(
                     id=file.id,
                     meta=file.meta,
@@ -158,6 +164,8 @@ class FilesTable:
             ]
 
     def get_file_metadatas_by_ids(self, ids: list[str]) -> list[FileMetadataResponse]:
+        # Select only the metadata columns so the extracted file content in
+        # File.data is never loaded
         with get_db() as db:
             return [
                 FileMetadataResponse(
@@ -166,7 +174,9 @@ class FilesTable:
                     created_at=file.created_at,
                     updated_at=file.updated_at,
                 )
-                for file in db.query(File)
+                for file in db.query(
+                    File.id, File.meta, File.created_at, File.updated_at
+                )
                 .filter(File.id.in_(ids))
                 .order_by(File.updated_at.desc())
                 .all()
@@ -211,6 +221,20 @@ class FilesTable:
             except Exception:
                 return None
 
+    def update_file_metadata_by_ids(
+        self, ids: list[str], meta: dict
+    ) -> list[FileModel]:
+        # Merge the same metadata into every file and commit once
+        with get_db() as db:
+            try:
+                files = db.query(File).filter(File.id.in_(ids)).all()
+                for file in files:
+                    file.meta = {**(file.meta if file.meta else {}), **meta}
+                db.commit()
+                return [FileModel.model_validate(file) for file in files]
+            except Exception:
+                return []
+
     def delete_file_by_id(self, id: str) -> bool:
         with get_db() as db:
             try:
@@ -8,7 +8,7 @@ from open_webui.models.chats import Chats
 
 from open_webui.env import SRC_LOG_LEVELS
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Column, Text, JSON, Boolean
+from sqlalchemy import BigInteger, Column, Index, Text, JSON, Boolean
 from open_webui.utils.access_control import get_permissions
 
 
@@ -33,6 +33,8 @@ class Folder(Base):
     created_at = Column(BigInteger)
     updated_at = Column(BigInteger)
 
+    __table_args__ = (Index("folder_user_id_parent_id_idx", "user_id", "parent_id"),)
+
 
 class FolderModel(BaseModel):
     id: str
@@ -8,7 +8,7 @@ from open_webui.models.tags import TagModel, Tag, Tags
 
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Boolean, Column, String, Text, JSON
+from sqlalchemy import BigInteger, Boolean, Column, Index, String, Text, JSON
 from sqlalchemy import or_, func, select, and_, text
 from sqlalchemy.sql import exists
 
@@ -25,6 +25,8 @@ class MessageReaction(Base):
     name = Column(Text)
     created_at = Column(BigInteger)
 
+    __table_args__ = (Index("message_reaction_message_id_idx", "message_id"),)
+
 
 class MessageReactionModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -52,6 +54,16 @@ class Message(Base):
     created_at = Column(BigInteger)  # time_ns
     updated_at = Column(BigInteger)  # time_ns
 
+    __table_args__ = (
+        Index(
+            "message_channel_id_parent_id_created_at_idx",
+            "channel_id",
+            "parent_id",
+            "created_at",
+        ),
+        Index("message_parent_id_created_at_idx", "parent_id", "created_at"),
+    )
+
 
 class MessageModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -150,6 +162,29 @@ class MessageTable:
             )
             return [MessageModel.model_validate(message) for message in all_messages]
 
+    def get_reply_stats_by_message_ids(
+        self, ids: list[str]
+    ) -> dict[str, tuple[int, Optional[int]]]:
+        # Reply count and latest reply timestamp for each parent, in one grouped query
+        if not ids:
+            return {}
+
+        with get_db() as db:
+            rows = (
+                db.query(
+                    Message.parent_id,
+                    func.count(Message.id),
+                    func.max(Message.created_at),
+                )
+                .filter(Message.parent_id.in_(ids))
+                .group_by(Message.parent_id)
+                .all()
+            )
+            return {
+                parent_id: (reply_count, latest_reply_at)
+                for parent_id, reply_count, latest_reply_at in rows
+            }
+
     def get_reply_user_ids_by_message_id(self, id: str) -> list[str]:
         with get_db() as db:
             return [
@@ -227,11 +262,24 @@ class MessageTable:
             return MessageReactionModel.model_validate(result) if result else None
 
     def get_reactions_by_message_id(self, id: str) -> list[Reactions]:
+        return self.get_reactions_by_message_ids([id]).get(id, [])
+
+    def get_reactions_by_message_ids(
+        self, ids: list[str]
+    ) -> dict[str, list[Reactions]]:
+        if not ids:
+            return {}
+
         with get_db() as db:
-            all_reactions = db.query(MessageReaction).filter_by(message_id=id).all()
+            all_reactions = (
+                db.query(MessageReaction)
+                .filter(MessageReaction.message_id.in_(ids))
+                .all()
+            )
 
-            reactions = {}
+            reactions_by_message = {}
             for reaction in all_reactions:
+                reactions = reactions_by_message.setdefault(reaction.message_id, {})
                 if reaction.name not in reactions:
                     reactions[reaction.name] = {
                         "name": reaction.name,
@@ -241,7 +289,10 @@ class MessageTable:
                 reactions[reaction.name]["user_ids"].append(reaction.user_id)
                 reactions[reaction.name]["count"] += 1
 
-            return [Reactions(**reaction) for reaction in reactions.values()]
+            return {
+                message_id: [Reactions(**reaction) for reaction in reactions.values()]
+                for message_id, reactions in reactions_by_message.items()
+            }
 
     def remove_reaction_by_id_and_user_id_and_name(
         self, id: str, user_id: str, name: str
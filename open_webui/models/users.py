@@ -10,7 +10,7 @@ from open_webui.models.groups import Groups
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import BigInteger, Column, String, Text
-from sqlalchemy import or_
+from sqlalchemy import func, or_, select
 
 
 ####################
@@ -174,16 +174,16 @@ class UsersTable:
         limit: Optional[int] = None,
     ) -> UserListResponse:
         with get_db() as db:
-            query = db.query(User)
+            # Select the unfiltered total with the page so listing is one round trip
+            total = select(func.count(User.id)).correlate(None).scalar_subquery()
+            query = db.query(User, total)
 
             if filter:
                 query_key = filter.get("query")
                 if query_key:
+                    pattern = f"%{query_key}%"
                     query = query.filter(
-                        or_(
-                            User.name.ilike(f"%{query_key}%"),
-                            User.email.ilike(f"%{query_key}%"),
-                        )
+                        or_(User.name.ilike(pattern), User.email.ilike(pattern))
                     )
 
                 order_by = filter.get("order_by")
@@ -231,10 +231,10 @@ class UsersTable:
             if limit:
                 query = query.limit(limit)
 
-            users = query.all()
+            rows = query.all()
             return {
-                "users": [UserModel.model_validate(user) for user in users],
-                "total": db.query(User).count(),
+                "users": [UserModel.model_validate(user) for user, _ in rows],
+                "total": rows[0][1] if rows else db.query(func.count(User.id)).scalar(),
             }
 
     def get_users_by_user_ids(self, user_ids: list[str]) -> list[UserModel]:
@@ -244,7 +244,7 @@ class UsersTable:
 
     def get_num_users(self) -> Optional[int]:
         with get_db() as db:
-            return db.query(User).count()
+            return db.query(func.count(User.id)).scalar()
 
     def get_first_user(self) -> UserModel:
         try:
@@ -257,13 +257,13 @@ class UsersTable:
     def get_user_webhook_url_by_id(self, id: str) -> Optional[str]:
         try:
             with get_db() as db:
-                user = db.query(User).filter_by(id=id).first()
+                settings = db.query(User.settings).filter_by(id=id).scalar()
 
-                if user.settings is None:
+                if settings is None:
                     return None
                 else:
                     return (
-                        user.settings.get("ui", {})
+                        settings.get("ui", {})
                         .get("notifications", {})
                         .get("webhook_url", None)
                     )
@@ -382,14 +382,13 @@ class UsersTable:
     def get_user_api_key_by_id(self, id: str) -> Optional[str]:
         try:
             with get_db() as db:
-                user = db.query(User).filter_by(id=id).first()
-                return user.api_key
+                return db.query(User.api_key).filter_by(id=id).scalar()
         except Exception:
             return None
 
     def get_valid_user_ids(self, user_ids: list[str]) -> list[str]:
         with get_db() as db:
-            users = db.query(User).filter(User.id.in_(user_ids)).all()
+            users = db.query(User.id).filter(User.id.in_(user_ids)).all()
             return [user.id for user in users]
 
     def get_super_admin_user(self) -> Optional[UserModel]:
@@ -7,6 +7,8 @@ from typing import List, Optional
 from langchain_core.documents import Document
 from fastapi import HTTPException, status
 
+from open_webui.utils.misc import dumps_indented
+
 log = logging.getLogger(__name__)
 
 
@@ -199,7 +201,7 @@ class DatalabMarkerLoader:
         raw_content = poll_result.get(content_key)
 
         if content_key == "json":
-            full_text = json.dumps(raw_content, indent=2)
+            full_text = dumps_indented(raw_content)
         elif content_key in {"markdown", "html"}:
             full_text = str(raw_content).strip()
         else:
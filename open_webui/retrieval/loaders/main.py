@@ -1,5 +1,6 @@
 import requests
 import logging
+import importlib.util
 import ftfy
 import sys
 import json
@@ -10,6 +11,7 @@ from langchain_community.document_loaders import (
     CSVLoader,
     Docx2txtLoader,
     OutlookMessageLoader,
+    PyMuPDFLoader,
     PyPDFLoader,
     TextLoader,
     UnstructuredEPubLoader,
@@ -22,6 +24,9 @@ from langchain_community.document_loaders import (
 )
 from langchain_core.documents import Document
 
+# PyMuPDF is much faster than pypdf; opt in with PDF_LOADER=pymupdf
+PYMUPDF_AVAILABLE = importlib.util.find_spec("fitz") is not None
+
 from open_webui.retrieval.loaders.external_document import ExternalDocumentLoader
 
 from open_webui.retrieval.loaders.mistral import MistralLoader
@@ -34,7 +39,7 @@ logging.basicConfig(stream=sys.stdout, level=GLOBAL_LOG_LEVEL)
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["RAG"])
 
-known_source_ext = [
+known_source_ext = {
     "go",
     "py",
     "java",
@@ -82,10 +87,9 @@ known_source_ext = [
     "erl",
     "tsx",
     "jsx",
-    "hs",
     "lhs",
     "json",
-]
+}
 
 
 class TikaLoader:
@@ -356,7 +360,12 @@ class Loader:
             )
         else:
             if file_ext == "pdf":
-                loader = PyPDFLoader(
+                pdf_loader = (
+                    PyMuPDFLoader
+                    if self.kwargs.get("PDF_LOADER") == "pymupdf" and PYMUPDF_AVAILABLE
+                    else PyPDFLoader
+                )
+                loader = pdf_loader(
                     file_path, extract_images=self.kwargs.get("PDF_EXTRACT_IMAGES")
                 )
             elif file_ext == "csv":
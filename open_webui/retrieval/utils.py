@@ -2,13 +2,12 @@ import logging
 import os
 from typing import Optional, Union
 
+import numpy as np
 import requests
-import hashlib
 from concurrent.futures import ThreadPoolExecutor
 import time
 
 from huggingface_hub import snapshot_download
-from langchain.retrievers import ContextualCompressionRetriever, EnsembleRetriever
 from langchain_community.retrievers import BM25Retriever
 from langchain_core.documents import Document
 
@@ -86,7 +85,7 @@ def query_doc(
         )
 
         if result:
-            log.info(f"query_doc:result {result.ids} {result.metadatas}")
+            log.info("query_doc:result %s %s", result.ids, result.metadatas)
 
         return result
     except Exception as e:
@@ -100,7 +99,7 @@ def get_doc(collection_name: str, user: UserModel = None):
         result = VECTOR_DB_CLIENT.get(collection_name=collection_name)
 
         if result:
-            log.info(f"query_doc:result {result.ids} {result.metadatas}")
+            log.info("query_doc:result %s %s", result.ids, result.metadatas)
 
         return result
     except Exception as e:
@@ -118,14 +117,12 @@ def query_doc_with_hybrid_search(
     k_reranker: int,
     r: float,
     hybrid_bm25_weight: float,
+    bm25_retriever: Optional[BM25Retriever] = None,
 ) -> dict:
     try:
         log.debug(f"query_doc_with_hybrid_search:doc {collection_name}")
-        bm25_retriever = BM25Retriever.from_texts(
-            texts=collection_result.documents[0],
-            metadatas=collection_result.metadatas[0],
-        )
-        bm25_retriever.k = k
+        if bm25_retriever is None and hybrid_bm25_weight > 0:
+            bm25_retriever = get_bm25_retriever(collection_result, k)
 
         vector_search_retriever = VectorSearchRetriever(
             collection_name=collection_name,
@@ -134,18 +131,16 @@ def query_doc_with_hybrid_search(
         )
 
         if hybrid_bm25_weight <= 0:
-            ensemble_retriever = EnsembleRetriever(
-                retrievers=[vector_search_retriever], weights=[1.0]
-            )
+            retrievers, weights = [vector_search_retriever], [1.0]
         elif hybrid_bm25_weight >= 1:
-            ensemble_retriever = EnsembleRetriever(
-                retrievers=[bm25_retriever], weights=[1.0]
-            )
+            retrievers, weights = [bm25_retriever], [1.0]
         else:
-            ensemble_retriever = EnsembleRetriever(
-                retrievers=[bm25_retriever, vector_search_retriever],
-                weights=[hybrid_bm25_weight, 1.0 - hybrid_bm25_weight],
-            )
+            retrievers = [bm25_retriever, vector_search_retriever]
+            weights = [hybrid_bm25_weight, 1.0 - hybrid_bm25_weight]
+
+        fused_documents = reciprocal_rank_fusion(
+            [retriever.invoke(query) for retriever in retrievers], weights
+        )
 
         compressor = RerankCompressor(
             embedding_function=embedding_function,
@@ -154,23 +149,22 @@ def query_doc_with_hybrid_search(
             r_score=r,
         )
 
-        compression_retriever = ContextualCompressionRetriever(
-            base_compressor=compressor, base_retriever=ensemble_retriever
+        result = (
+            list(compressor.compress_documents(fused_documents, query))
+            if fused_documents
+            else []
         )
 
-        result = compression_retriever.invoke(query)
-
         distances = [d.metadata.get("score") for d in result]
         documents = [d.page_content for d in result]
         metadatas = [d.metadata for d in result]
 
-        # retrieve only min(k, k_reranker) items, sort and cut by distance if k < k_reranker
+        # retrieve only min(k, k_reranker) items, the compressor already returns
+        # them sorted by distance so cutting the head is enough if k < k_reranker
         if k < k_reranker:
-            sorted_items = sorted(
-                zip(distances, metadatas, documents), key=lambda x: x[0], reverse=True
-            )
-            sorted_items = sorted_items[:k]
-            distances, documents, metadatas = map(list, zip(*sorted_items))
+            distances = distances[:k]
+            documents = documents[:k]
+            metadatas = metadatas[:k]
 
         result = {
             "distances": [distances],
@@ -179,8 +173,9 @@ def query_doc_with_hybrid_search(
         }
 
         log.info(
-            "query_doc_with_hybrid_search:result "
-            + f'{result["metadatas"]} {result["distances"]}'
+            "query_doc_with_hybrid_search:result %s %s",
+            result["metadatas"],
+            result["distances"],
         )
         return result
     except Exception as e:
@@ -188,6 +183,74 @@ def query_doc_with_hybrid_search(
         raise e
 
 
+def get_bm25_retriever(collection_result: GetResult, k: int) -> BM25Retriever:
+    # Tokenizing the collection is the expensive part of BM25, so callers that
+    # search one collection with several queries should build this once
+    bm25_retriever = BM25Retriever.from_texts(
+        texts=collection_result.documents[0],
+        metadatas=collection_result.metadatas[0],
+    )
+    bm25_retriever.k = k
+    return bm25_retriever
+
+
+def reciprocal_rank_fusion(
+    doc_lists: list[list[Document]], weights: list[float], c: int = 60
+) -> list[Document]:
+    """
+    Fuse ranked document lists with weighted Reciprocal Rank Fusion.
+
+    Each document scores sum(weight / (c + rank)) over the lists it appears in.
+    Documents are deduplicated by page content and returned best first, ties
+    keeping their first-seen order.
+    """
+    slots = {}
+    unique_documents = []
+    list_slots = []
+    for doc_list in doc_lists:
+        indices = np.empty(len(doc_list), dtype=np.intp)
+        for rank, doc in enumerate(doc_list):
+            slot = slots.get(doc.page_content)
+            if slot is None:
+                slot = slots[doc.page_content] = len(unique_documents)
+                unique_documents.append(doc)
+            indices[rank] = slot
+        list_slots.append(indices)
+
+    scores = np.zeros(len(unique_documents), dtype=np.float64)
+    for indices, weight in zip(list_slots, weights):
+        np.add.at(scores, indices, weight / (c + np.arange(1, len(indices) + 1)))
+
+    return [unique_documents[i] for i in np.argsort(-scores, kind="stable")]
+
+
+def get_top_k_indices(scores, k: int) -> np.ndarray:
+    """
+    Return the indices of the k highest scores, best first.
+
+    Uses a linear-time partition instead of sorting every score. Equal scores
+    keep their original order, matching a stable descending sort. NaN scores
+    rank last, so k indices are always returned when there are k scores.
+    """
+    # A NaN threshold would compare false with every score and drop results
+    scores = np.nan_to_num(
+        np.asarray(scores, dtype=np.float64), nan=-np.inf, posinf=np.inf, neginf=-np.inf
+    )
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+
+    if k < n:
+        threshold = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[: k - len(above)]
+        candidates = np.sort(np.concatenate((above, ties)))
+    else:
+        candidates = np.arange(n)
+
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
 def merge_get_results(get_results: list[dict]) -> dict:
     # Initialize lists to store combined data
     combined_documents = []
@@ -211,7 +274,8 @@ def merge_get_results(get_results: list[dict]) -> dict:
 
 def merge_and_sort_query_results(query_results: list[dict], k: int) -> dict:
     # Initialize lists to store combined data
-    combined = dict()  # To store documents with unique document hashes
+    # Documents are keyed by their own text, whose hash Python caches on the str
+    combined = dict()
 
     for data in query_results:
         distances = data["distances"][0]
@@ -220,25 +284,18 @@ def merge_and_sort_query_results(query_results: list[dict], k: int) -> dict:
 
         for distance, document, metadata in zip(distances, documents, metadatas):
             if isinstance(document, str):
-                doc_hash = hashlib.sha256(
-                    document.encode()
-                ).hexdigest()  # Compute a hash for uniqueness
-
-                if doc_hash not in combined.keys():
-                    combined[doc_hash] = (distance, document, metadata)
-                    continue  # if doc is new, no further comparison is needed
+                existing = combined.get(document)
 
-                # if doc is alredy in, but new distance is better, update
-                if distance > combined[doc_hash][0]:
-                    combined[doc_hash] = (distance, document, metadata)
+                # keep the doc if it is new or the new distance is better
+                if existing is None or distance > existing[0]:
+                    combined[document] = (distance, document, metadata)
 
     combined = list(combined.values())
-    # Sort the list based on distances
-    combined.sort(key=lambda x: x[0], reverse=True)
+    # Keep only the top k elements, sorted by distance
+    top_k = get_top_k_indices([item[0] for item in combined], k)
 
-    # Slice to keep only the top k elements
     sorted_distances, sorted_documents, sorted_metadatas = (
-        zip(*combined[:k]) if combined else ([], [], [])
+        zip(*[combined[i] for i in top_k]) if len(top_k) else ([], [], [])
     )
 
     # Create and return the output dictionary
@@ -250,18 +307,24 @@ def merge_and_sort_query_results(query_results: list[dict], k: int) -> dict:
 
 
 def get_all_items_from_collections(collection_names: list[str]) -> dict:
-    results = []
+    def get_collection_items(collection_name):
+        try:
+            result = get_doc(collection_name=collection_name)
+            if result is not None:
+                return result.model_dump()
+        except Exception as e:
+            log.exception(f"Error when querying the collection: {e}")
+        return None
 
-    for collection_name in collection_names:
-        if collection_name:
-            try:
-                result = get_doc(collection_name=collection_name)
-                if result is not None:
-                    results.append(result.model_dump())
-            except Exception as e:
-                log.exception(f"Error when querying the collection: {e}")
-        else:
-            pass
+    # Collections are independent, so read them concurrently
+    with ThreadPoolExecutor() as executor:
+        results = [
+            result
+            for result in executor.map(
+                get_collection_items, [cn for cn in collection_names if cn]
+            )
+            if result is not None
+        ]
 
     return merge_get_results(results)
 
@@ -330,20 +393,39 @@ def query_collection_with_hybrid_search(
 ) -> dict:
     results = []
     error = False
-    # Fetch collection data once per collection sequentially
-    # Avoid fetching the same data multiple times later
-    collection_results = {}
-    for collection_name in collection_names:
+
+    def fetch_collection(collection_name):
         try:
             log.debug(
                 f"query_collection_with_hybrid_search:VECTOR_DB_CLIENT.get:collection {collection_name}"
             )
-            collection_results[collection_name] = VECTOR_DB_CLIENT.get(
-                collection_name=collection_name
-            )
+            return VECTOR_DB_CLIENT.get(collection_name=collection_name)
         except Exception as e:
             log.exception(f"Failed to fetch collection {collection_name}: {e}")
-            collection_results[collection_name] = None
+            return None
+
+    # Fetch collection data once per collection, concurrently
+    # Avoid fetching the same data multiple times later
+    collection_names = list(collection_names)
+    with ThreadPoolExecutor() as executor:
+        collection_results = dict(
+            zip(collection_names, executor.map(fetch_collection, collection_names))
+        )
+
+    # Build each collection's BM25 index once and share it across all queries
+    bm25_retrievers = {}
+    if hybrid_bm25_weight > 0:
+        for collection_name, collection_result in collection_results.items():
+            if collection_result is None:
+                continue
+            try:
+                bm25_retrievers[collection_name] = get_bm25_retriever(
+                    collection_result, k
+                )
+            except Exception as e:
+                log.exception(
+                    f"Failed to build BM25 index for collection {collection_name}: {e}"
+                )
 
     log.info(
         f"Starting hybrid search for {len(queries)} queries in {len(collection_names)} collections..."
@@ -361,6 +443,7 @@ def query_collection_with_hybrid_search(
                 k_reranker=k_reranker,
                 r=r,
                 hybrid_bm25_weight=hybrid_bm25_weight,
+                bm25_retriever=bm25_retrievers.get(collection_name),
             )
             return result, None
         except Exception as e:
@@ -455,9 +538,17 @@ def get_sources_from_files(
     full_context=False,
 ):
     log.debug(
-        f"files: {files} {queries} {embedding_function} {reranking_function} {full_context}"
+        "files: %s %s %s %s %s",
+        files,
+        queries,
+        embedding_function,
+        reranking_function,
+        full_context,
     )
 
+    # Generated queries often repeat; embed and search each distinct one once
+    queries = list(dict.fromkeys(queries))
+
     extracted_collections = []
     relevant_contexts = []
 
@@ -848,13 +939,18 @@ def generate_embeddings(
         return embeddings[0] if isinstance(text, str) else embeddings
 
 
-import operator
 from typing import Optional, Sequence
 
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
 
 
+def normalize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    # Scale each vector (last axis) to unit length, leaving zero vectors as zeros
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
 class RerankCompressor(BaseDocumentCompressor):
     embedding_function: Any
     top_n: int
@@ -878,27 +974,38 @@ class RerankCompressor(BaseDocumentCompressor):
                 [(query, doc.page_content) for doc in documents]
             )
         else:
-            from sentence_transformers import util
-
-            query_embedding = self.embedding_function(query, RAG_EMBEDDING_QUERY_PREFIX)
-            document_embedding = self.embedding_function(
-                [doc.page_content for doc in documents], RAG_EMBEDDING_CONTENT_PREFIX
+            # Pack the embeddings into contiguous float32 buffers and scale them
+            # to unit length once, so cosine similarity is a single dot product
+            query_embedding = normalize_embeddings(
+                np.asarray(
+                    self.embedding_function(query, RAG_EMBEDDING_QUERY_PREFIX),
+                    dtype=np.float32,
+                )
+            )
+            document_embedding = normalize_embeddings(
+                np.asarray(
+                    self.embedding_function(
+                        [doc.page_content for doc in documents],
+                        RAG_EMBEDDING_CONTENT_PREFIX,
+                    ),
+                    dtype=np.float32,
+                )
             )
-            scores = util.cos_sim(query_embedding, document_embedding)[0]
+            scores = document_embedding @ query_embedding
 
-        docs_with_scores = list(
-            zip(documents, scores.tolist() if not isinstance(scores, list) else scores)
+        scores = np.asarray(
+            scores.tolist() if not isinstance(scores, list) else scores,
+            dtype=np.float64,
         )
+        candidates = np.arange(len(documents))
         if self.r_score:
-            docs_with_scores = [
-                (d, s) for d, s in docs_with_scores if s >= self.r_score
-            ]
+            candidates = candidates[scores >= self.r_score]
 
-        result = sorted(docs_with_scores, key=operator.itemgetter(1), reverse=True)
         final_results = []
-        for doc, doc_score in result[: self.top_n]:
+        for idx in candidates[get_top_k_indices(scores[candidates], self.top_n)]:
+            doc = documents[idx]
             metadata = doc.metadata
-            metadata["score"] = doc_score
+            metadata["score"] = float(scores[idx])
             doc = Document(
                 page_content=doc.page_content,
                 metadata=metadata,
@@ -1,4 +1,5 @@
 import chromadb
+import chromadb.errors
 import logging
 from chromadb import Settings
 from chromadb.utils.batch_utils import create_batches
@@ -27,6 +28,14 @@ from open_webui.env import SRC_LOG_LEVELS
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["RAG"])
 
+# Raised by get_collection for a missing collection: NotFoundError in recent clients,
+# InvalidCollectionException or ValueError in older ones
+COLLECTION_NOT_FOUND_ERRORS = tuple(
+    getattr(chromadb.errors, name)
+    for name in ("NotFoundError", "InvalidCollectionException")
+    if hasattr(chromadb.errors, name)
+) + (ValueError,)
+
 
 class ChromaClient(VectorDBBase):
     def __init__(self):
@@ -60,9 +69,14 @@ class ChromaClient(VectorDBBase):
             )
 
     def has_collection(self, collection_name: str) -> bool:
-        # Check if the collection exists based on the collection name.
-        collection_names = self.client.list_collections()
-        return collection_name in collection_names
+        # Check if the collection exists by looking it up directly instead of
+        # listing every collection. Only a missing collection means False;
+        # connection, auth and server errors propagate.
+        try:
+            self.client.get_collection(name=collection_name)
+            return True
+        except COLLECTION_NOT_FOUND_ERRORS:
+            return False
 
     def delete_collection(self, collection_name: str):
         # Delete the collection based on the collection name.
@@ -3,28 +3,26 @@ import logging
 import json
 from sqlalchemy import (
     func,
+    inspect,
     literal,
     cast,
     column,
     create_engine,
     Column,
     Integer,
-    MetaData,
     LargeBinary,
     select,
     text,
     Text,
-    Table,
     values,
 )
 from sqlalchemy.sql import true
 from sqlalchemy.pool import NullPool
 
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
-from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.dialects.postgresql import JSONB
 from pgvector.sqlalchemy import Vector
 from sqlalchemy.ext.mutable import MutableDict
-from sqlalchemy.exc import NoSuchTableError
 
 from open_webui.retrieval.vector.main import (
     VectorDBBase,
@@ -56,6 +54,14 @@ def pgcrypto_decrypt(col, key, outtype="text"):
     return func.cast(func.pgp_sym_decrypt(col, literal(key)), outtype)
 
 
+def split_rows(rows) -> tuple[list, list, list]:
+    # Unzip (id, text, vmetadata) rows into columns in a single pass
+    if not rows:
+        return [], [], []
+    ids, documents, metadatas = zip(*rows)
+    return list(ids), list(documents), list(metadatas)
+
+
 class DocumentChunk(Base):
     __tablename__ = "document_chunk"
 
@@ -135,20 +141,20 @@ class PgvectorClient(VectorDBBase):
         Check if the VECTOR_LENGTH matches the existing vector column dimension in the database.
         Raises an exception if there is a mismatch.
         """
-        metadata = MetaData()
-        try:
-            # Attempt to reflect the 'document_chunk' table
-            document_chunk_table = Table(
-                "document_chunk", metadata, autoload_with=self.session.bind
-            )
-        except NoSuchTableError:
+        # Only the column types are needed, so skip reflecting keys and indexes
+        inspector = inspect(self.session.bind)
+        if not inspector.has_table("document_chunk"):
             # Table does not exist; no action needed
             return
 
+        column_types = {
+            column["name"]: column["type"]
+            for column in inspector.get_columns("document_chunk")
+        }
+
         # Proceed to check the vector column
-        if "vector" in document_chunk_table.columns:
-            vector_column = document_chunk_table.columns["vector"]
-            vector_type = vector_column.type
+        if "vector" in column_types:
+            vector_type = column_types["vector"]
             if isinstance(vector_type, Vector):
                 db_vector_length = vector_type.dim
                 if db_vector_length != VECTOR_LENGTH:
@@ -177,33 +183,37 @@ class PgvectorClient(VectorDBBase):
         return vector
 
     def insert(self, collection_name: str, items: List[VectorItem]) -> None:
+        if not items:
+            return
         try:
             if PGVECTOR_PGCRYPTO:
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    # Use raw SQL for BYTEA/pgcrypto
-                    self.session.execute(
-                        text(
-                            """
-                            INSERT INTO document_chunk
-                            (id, vector, collection_name, text, vmetadata)
-                            VALUES (
-                                :id, :vector, :collection_name,
-                                pgp_sym_encrypt(:text, :key),
-                                pgp_sym_encrypt(:metadata::text, :key)
-                            )
-                            ON CONFLICT (id) DO NOTHING
+                # Use raw SQL for BYTEA/pgcrypto, passing all rows at once so the
+                # statement is prepared a single time
+                self.session.execute(
+                    text(
                         """
-                        ),
+                        INSERT INTO document_chunk
+                        (id, vector, collection_name, text, vmetadata)
+                        VALUES (
+                            :id, :vector, :collection_name,
+                            pgp_sym_encrypt(:text, :key),
+                            pgp_sym_encrypt(:metadata::text, :key)
+                        )
+                        ON CONFLICT (id) DO NOTHING
+                    """
+                    ),
+                    [
                         {
                             "id": item["id"],
-                            "vector": vector,
+                            "vector": self.adjust_vector_length(item["vector"]),
                             "collection_name": collection_name,
                             "text": item["text"],
                             "metadata": json.dumps(item["metadata"]),
                             "key": PGVECTOR_PGCRYPTO_KEY,
-                        },
-                    )
+                        }
+                        for item in items
+                    ],
+                )
                 self.session.commit()
                 log.info(f"Encrypted & inserted {len(items)} into '{collection_name}'")
 
@@ -230,36 +240,40 @@ class PgvectorClient(VectorDBBase):
             raise
 
     def upsert(self, collection_name: str, items: List[VectorItem]) -> None:
+        if not items:
+            return
         try:
             if PGVECTOR_PGCRYPTO:
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    self.session.execute(
-                        text(
-                            """
-                            INSERT INTO document_chunk
-                            (id, vector, collection_name, text, vmetadata)
-                            VALUES (
-                                :id, :vector, :collection_name,
-                                pgp_sym_encrypt(:text, :key),
-                                pgp_sym_encrypt(:metadata::text, :key)
-                            )
-                            ON CONFLICT (id) DO UPDATE SET
-                              vector = EXCLUDED.vector,
-                              collection_name = EXCLUDED.collection_name,
-                              text = EXCLUDED.text,
-                              vmetadata = EXCLUDED.vmetadata
+                # Pass all rows at once so the statement is prepared a single time
+                self.session.execute(
+                    text(
                         """
-                        ),
+                        INSERT INTO document_chunk
+                        (id, vector, collection_name, text, vmetadata)
+                        VALUES (
+                            :id, :vector, :collection_name,
+                            pgp_sym_encrypt(:text, :key),
+                            pgp_sym_encrypt(:metadata::text, :key)
+                        )
+                        ON CONFLICT (id) DO UPDATE SET
+                          vector = EXCLUDED.vector,
+                          collection_name = EXCLUDED.collection_name,
+                          text = EXCLUDED.text,
+                          vmetadata = EXCLUDED.vmetadata
+                    """
+                    ),
+                    [
                         {
                             "id": item["id"],
-                            "vector": vector,
+                            "vector": self.adjust_vector_length(item["vector"]),
                             "collection_name": collection_name,
                             "text": item["text"],
                             "metadata": json.dumps(item["metadata"]),
                             "key": PGVECTOR_PGCRYPTO_KEY,
-                        },
-                    )
+                        }
+                        for item in items
+                    ],
+                )
                 self.session.commit()
                 log.info(f"Encrypted & upserted {len(items)} into '{collection_name}'")
             else:
@@ -310,7 +324,11 @@ class PgvectorClient(VectorDBBase):
             num_queries = len(vectors)
 
             def vector_expr(vector):
-                return cast(array(vector), Vector(VECTOR_LENGTH))
+                # Bind the whole vector as one parameter instead of an ARRAY[...]
+                # with a parameter per dimension
+                return cast(
+                    literal(vector, Vector(VECTOR_LENGTH)), Vector(VECTOR_LENGTH)
+                )
 
             # Create the values for query vectors
             qid_col = column("qid", Integer)
@@ -432,9 +450,10 @@ class PgvectorClient(VectorDBBase):
                     stmt = stmt.limit(limit)
                 results = self.session.execute(stmt).all()
             else:
-                query = self.session.query(DocumentChunk).filter(
-                    DocumentChunk.collection_name == collection_name
-                )
+                # Select only the returned columns so rows skip ORM and vector decoding
+                query = self.session.query(
+                    DocumentChunk.id, DocumentChunk.text, DocumentChunk.vmetadata
+                ).filter(DocumentChunk.collection_name == collection_name)
 
                 for key, value in filter.items():
                     query = query.filter(
@@ -449,14 +468,12 @@ class PgvectorClient(VectorDBBase):
             if not results:
                 return None
 
-            ids = [[result.id for result in results]]
-            documents = [[result.text for result in results]]
-            metadatas = [[result.vmetadata for result in results]]
+            ids, documents, metadatas = split_rows(results)
 
             return GetResult(
-                ids=ids,
-                documents=documents,
-                metadatas=metadatas,
+                ids=[ids],
+                documents=[documents],
+                metadatas=[metadatas],
             )
         except Exception as e:
             log.exception(f"Error during query: {e}")
@@ -479,14 +496,11 @@ class PgvectorClient(VectorDBBase):
                 if limit is not None:
                     stmt = stmt.limit(limit)
                 results = self.session.execute(stmt).all()
-                ids = [[row.id for row in results]]
-                documents = [[row.text for row in results]]
-                metadatas = [[row.vmetadata for row in results]]
             else:
-
-                query = self.session.query(DocumentChunk).filter(
-                    DocumentChunk.collection_name == collection_name
-                )
+                # Select only the returned columns so rows skip ORM and vector decoding
+                query = self.session.query(
+                    DocumentChunk.id, DocumentChunk.text, DocumentChunk.vmetadata
+                ).filter(DocumentChunk.collection_name == collection_name)
                 if limit is not None:
                     query = query.limit(limit)
 
@@ -495,11 +509,9 @@ class PgvectorClient(VectorDBBase):
                 if not results:
                     return None
 
-                ids = [[result.id for result in results]]
-                documents = [[result.text for result in results]]
-                metadatas = [[result.vmetadata for result in results]]
+            ids, documents, metadatas = split_rows(results)
 
-            return GetResult(ids=ids, documents=documents, metadatas=metadatas)
+            return GetResult(ids=[ids], documents=[documents], metadatas=[metadatas])
         except Exception as e:
             log.exception(f"Error during get: {e}")
             return None
@@ -12,7 +12,7 @@ log.setLevel(SRC_LOG_LEVELS["RAG"])
 EXA_API_BASE = "https://api.exa.ai"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExaResult:
     url: str
     title: str
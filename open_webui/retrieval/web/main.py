@@ -9,13 +9,15 @@ from pydantic import BaseModel
 def get_filtered_results(results, filter_list):
     if not filter_list:
         return results
+    # str.endswith checks every filtered domain in a single call
+    filter_domains = tuple(filter_list)
     filtered_results = []
     for result in results:
         url = result.get("url") or result.get("link", "")
         if not validators.url(url):
             continue
         domain = urlparse(url).netloc
-        if any(domain.endswith(filtered_domain) for filtered_domain in filter_list):
+        if domain.endswith(filter_domains):
             filtered_results.append(result)
     return filtered_results
 
@@ -1059,20 +1059,13 @@ def get_available_voices(request) -> dict:
             url = (
                 base_url or f"https://{region}.tts.speech.microsoft.com"
             ) + "/cognitiveservices/voices/list"
-            headers = {
-                "Ocp-Apim-Subscription-Key": request.app.state.config.TTS_API_KEY
-            }
-
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            voices = response.json()
 
-            for voice in voices:
-                available_voices[voice["ShortName"]] = (
-                    f"{voice['DisplayName']} ({voice['ShortName']})"
-                )
-        except requests.RequestException as e:
-            log.error(f"Error fetching voices: {str(e)}")
+            available_voices = get_azure_voices(
+                url=url, api_key=request.app.state.config.TTS_API_KEY
+            )
+        except Exception:
+            # Avoided @lru_cache with exception; log it so failures are not silent
+            log.exception("Error fetching Azure voices")
 
     return available_voices
 
@@ -1110,6 +1103,26 @@ def get_elevenlabs_voices(api_key: str) -> dict:
     return voices
 
 
+@lru_cache
+def get_azure_voices(url: str, api_key: str) -> dict:
+    try:
+        response = requests.get(url, headers={"Ocp-Apim-Subscription-Key": api_key})
+        response.raise_for_status()
+        voices_data = response.json()
+
+        voices = {}
+        for voice in voices_data:
+            voices[voice["ShortName"]] = (
+                f"{voice['DisplayName']} ({voice['ShortName']})"
+            )
+    except requests.RequestException as e:
+        # Avoid @lru_cache with exception
+        log.error(f"Error fetching voices: {str(e)}")
+        raise RuntimeError(f"Error fetching voices: {str(e)}")
+
+    return voices
+
+
 @router.get("/voices")
 async def get_voices(request: Request, user=Depends(get_verified_user)):
     return {
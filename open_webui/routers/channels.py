@@ -161,6 +161,9 @@ async def get_channel_messages(
         )
 
     message_list = Messages.get_messages_by_channel_id(id, skip, limit)
+    message_ids = [message.id for message in message_list]
+    reply_stats = Messages.get_reply_stats_by_message_ids(message_ids)
+    reactions = Messages.get_reactions_by_message_ids(message_ids)
     users = {}
 
     messages = []
@@ -169,16 +172,15 @@ async def get_channel_messages(
             user = Users.get_user_by_id(message.user_id)
             users[message.user_id] = user
 
-        replies = Messages.get_replies_by_message_id(message.id)
-        latest_reply_at = replies[0].created_at if replies else None
+        reply_count, latest_reply_at = reply_stats.get(message.id, (0, None))
 
         messages.append(
             MessageUserResponse(
                 **{
                     **message.model_dump(),
-                    "reply_count": len(replies),
+                    "reply_count": reply_count,
                     "latest_reply_at": latest_reply_at,
-                    "reactions": Messages.get_reactions_by_message_id(message.id),
+                    "reactions": reactions.get(message.id, []),
                     "user": UserNameResponse(**users[message.user_id].model_dump()),
                 }
             )
@@ -390,6 +392,9 @@ async def get_channel_thread_messages(
         )
 
     message_list = Messages.get_messages_by_parent_id(id, message_id, skip, limit)
+    reactions = Messages.get_reactions_by_message_ids(
+        [message.id for message in message_list]
+    )
     users = {}
 
     messages = []
@@ -404,7 +409,7 @@ async def get_channel_thread_messages(
                     **message.model_dump(),
                     "reply_count": 0,
                     "latest_reply_at": None,
-                    "reactions": Messages.get_reactions_by_message_id(message.id),
+                    "reactions": reactions.get(message.id, []),
                     "user": UserNameResponse(**users[message.user_id].model_dump()),
                 }
             )
@@ -18,6 +18,7 @@ from open_webui.config import ENABLE_ADMIN_CHAT_ACCESS, ENABLE_ADMIN_EXPORT
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import SRC_LOG_LEVELS
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 
@@ -167,12 +168,14 @@ async def search_user_chats(
     limit = 60
     skip = (page - 1) * limit
 
-    chat_list = [
-        ChatTitleIdResponse(**chat.model_dump())
-        for chat in Chats.get_chats_by_user_id_and_search_text(
-            user.id, text, skip=skip, limit=limit
-        )
-    ]
+    # Full-text search scans every chat of the user, so keep it off the event loop
+    chat_list = await run_in_threadpool(
+        Chats.get_chats_by_user_id_and_search_text,
+        user.id,
+        text,
+        skip=skip,
+        limit=limit,
+    )
 
     # Delete tag if no chat is found
     words = text.strip().split(" ")
@@ -226,10 +229,8 @@ async def get_user_pinned_chats(user=Depends(get_verified_user)):
 
 @router.get("/all", response_model=list[ChatResponse])
 async def get_user_chats(user=Depends(get_verified_user)):
-    return [
-        ChatResponse(**chat.model_dump())
-        for chat in Chats.get_chats_by_user_id(user.id)
-    ]
+    # ChatModel has the same fields; response_model serializes it directly
+    return Chats.get_chats_by_user_id(user.id)
 
 
 ############################
@@ -239,10 +240,7 @@ async def get_user_chats(user=Depends(get_verified_user)):
 
 @router.get("/all/archived", response_model=list[ChatResponse])
 async def get_user_archived_chats(user=Depends(get_verified_user)):
-    return [
-        ChatResponse(**chat.model_dump())
-        for chat in Chats.get_archived_chats_by_user_id(user.id)
-    ]
+    return Chats.get_archived_chats_by_user_id(user.id)
 
 
 ############################
@@ -274,7 +272,7 @@ async def get_all_user_chats_in_db(user=Depends(get_admin_user)):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
         )
-    return [ChatResponse(**chat.model_dump()) for chat in Chats.get_chats()]
+    return Chats.get_chats()
 
 
 ############################
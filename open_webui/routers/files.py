@@ -36,6 +36,7 @@ from open_webui.routers.retrieval import ProcessFileForm, process_file
 from open_webui.routers.audio import transcribe
 from open_webui.storage.provider import Storage
 from open_webui.utils.auth import get_admin_user, get_verified_user
+from open_webui.utils.access_control import has_access
 from pydantic import BaseModel
 
 log = logging.getLogger(__name__)
@@ -62,19 +63,16 @@ def has_access_to_file(
             detail=ERROR_MESSAGES.NOT_FOUND,
         )
 
-    has_access = False
     knowledge_base_id = file.meta.get("collection_name") if file.meta else None
+    if not knowledge_base_id:
+        return False
 
-    if knowledge_base_id:
-        knowledge_bases = Knowledges.get_knowledge_bases_by_user_id(
-            user.id, access_type
-        )
-        for knowledge_base in knowledge_bases:
-            if knowledge_base.id == knowledge_base_id:
-                has_access = True
-                break
-
-    return has_access
+    # Check the file's own knowledge base instead of listing every knowledge base
+    knowledge_base = Knowledges.get_knowledge_by_id(knowledge_base_id)
+    return knowledge_base is not None and (
+        knowledge_base.user_id == user.id
+        or has_access(user.id, access_type, knowledge_base.access_control)
+    )
 
 
 ############################
@@ -111,12 +109,9 @@ def upload_file(
         # Remove the leading dot from the file extension
         file_extension = file_extension[1:] if file_extension else ""
 
-        if (not internal) and request.app.state.config.ALLOWED_FILE_EXTENSIONS:
-            request.app.state.config.ALLOWED_FILE_EXTENSIONS = [
-                ext for ext in request.app.state.config.ALLOWED_FILE_EXTENSIONS if ext
-            ]
-
-            if file_extension not in request.app.state.config.ALLOWED_FILE_EXTENSIONS:
+        allowed_file_extensions = request.app.state.config.ALLOWED_FILE_EXTENSIONS
+        if (not internal) and allowed_file_extensions:
+            if file_extension not in {ext for ext in allowed_file_extensions if ext}:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=ERROR_MESSAGES.DEFAULT(
@@ -58,16 +58,16 @@ async def get_knowledge(user=Depends(get_verified_user)):
 
             # Check if all files exist
             if len(files) != len(knowledge_base.data.get("file_ids", [])):
-                missing_files = list(
-                    set(knowledge_base.data.get("file_ids", []))
-                    - set([file.id for file in files])
-                )
+                missing_files = set(knowledge_base.data.get("file_ids", [])) - {
+                    file.id for file in files
+                }
                 if missing_files:
                     data = knowledge_base.data or {}
-                    file_ids = data.get("file_ids", [])
-
-                    for missing_file in missing_files:
-                        file_ids.remove(missing_file)
+                    file_ids = [
+                        file_id
+                        for file_id in data.get("file_ids", [])
+                        if file_id not in missing_files
+                    ]
 
                     data["file_ids"] = file_ids
                     Knowledges.update_knowledge_data_by_id(
@@ -106,16 +106,16 @@ async def get_knowledge_list(user=Depends(get_verified_user)):
 
             # Check if all files exist
             if len(files) != len(knowledge_base.data.get("file_ids", [])):
-                missing_files = list(
-                    set(knowledge_base.data.get("file_ids", []))
-                    - set([file.id for file in files])
-                )
+                missing_files = set(knowledge_base.data.get("file_ids", [])) - {
+                    file.id for file in files
+                }
                 if missing_files:
                     data = knowledge_base.data or {}
-                    file_ids = data.get("file_ids", [])
-
-                    for missing_file in missing_files:
-                        file_ids.remove(missing_file)
+                    file_ids = [
+                        file_id
+                        for file_id in data.get("file_ids", [])
+                        if file_id not in missing_files
+                    ]
 
                     data["file_ids"] = file_ids
                     Knowledges.update_knowledge_data_by_id(
@@ -74,29 +74,34 @@ log.setLevel(SRC_LOG_LEVELS["OLLAMA"])
 ##########################################
 
 
-async def send_get_request(url, key=None, user: UserModel = None):
-    timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST)
-    try:
+async def send_get_request(
+    url, key=None, user: UserModel = None, session: aiohttp.ClientSession = None
+):
+    if session is None:
+        timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST)
         async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
-            async with session.get(
-                url,
-                headers={
-                    "Content-Type": "application/json",
-                    **({"Authorization": f"Bearer {key}"} if key else {}),
-                    **(
-                        {
-                            "X-OpenWebUI-User-Name": user.name,
-                            "X-OpenWebUI-User-Id": user.id,
-                            "X-OpenWebUI-User-Email": user.email,
-                            "X-OpenWebUI-User-Role": user.role,
-                        }
-                        if ENABLE_FORWARD_USER_INFO_HEADERS and user
-                        else {}
-                    ),
-                },
-                ssl=AIOHTTP_CLIENT_SESSION_SSL,
-            ) as response:
-                return await response.json()
+            return await send_get_request(url, key, user=user, session=session)
+
+    try:
+        async with session.get(
+            url,
+            headers={
+                "Content-Type": "application/json",
+                **({"Authorization": f"Bearer {key}"} if key else {}),
+                **(
+                    {
+                        "X-OpenWebUI-User-Name": user.name,
+                        "X-OpenWebUI-User-Id": user.id,
+                        "X-OpenWebUI-User-Email": user.email,
+                        "X-OpenWebUI-User-Role": user.role,
+                    }
+                    if ENABLE_FORWARD_USER_INFO_HEADERS and user
+                    else {}
+                ),
+            },
+            ssl=AIOHTTP_CLIENT_SESSION_SSL,
+        ) as response:
+            return await response.json()
     except Exception as e:
         # Handle connection error here
         log.error(f"Connection error: {e}")
@@ -322,12 +327,20 @@ def merge_ollama_models_lists(model_lists):
 async def get_all_models(request: Request, user: UserModel = None):
     log.info("get_all_models()")
     if request.app.state.config.ENABLE_OLLAMA_API:
+        # Share one session across the fan-out instead of opening one per URL
+        session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST),
+            trust_env=True,
+        )
+
         request_tasks = []
         for idx, url in enumerate(request.app.state.config.OLLAMA_BASE_URLS):
             if (str(idx) not in request.app.state.config.OLLAMA_API_CONFIGS) and (
                 url not in request.app.state.config.OLLAMA_API_CONFIGS  # Legacy support
             ):
-                request_tasks.append(send_get_request(f"{url}/api/tags", user=user))
+                request_tasks.append(
+                    send_get_request(f"{url}/api/tags", user=user, session=session)
+                )
             else:
                 api_config = request.app.state.config.OLLAMA_API_CONFIGS.get(
                     str(idx),
@@ -341,12 +354,17 @@ async def get_all_models(request: Request, user: UserModel = None):
 
                 if enable:
                     request_tasks.append(
-                        send_get_request(f"{url}/api/tags", key, user=user)
+                        send_get_request(
+                            f"{url}/api/tags", key, user=user, session=session
+                        )
                     )
                 else:
                     request_tasks.append(asyncio.ensure_future(asyncio.sleep(0, None)))
 
-        responses = await asyncio.gather(*request_tasks)
+        try:
+            responses = await asyncio.gather(*request_tasks)
+        finally:
+            await session.close()
 
         for idx, response in enumerate(responses):
             if response:
@@ -418,9 +436,16 @@ async def get_all_models(request: Request, user: UserModel = None):
 
 async def get_filtered_models(models, user):
     # Filter models based on user access control
+    model_infos = {
+        model_info.id: model_info
+        for model_info in Models.get_models_by_ids(
+            [model["model"] for model in models.get("models", [])]
+        )
+    }
+
     filtered_models = []
     for model in models.get("models", []):
-        model_info = Models.get_model_by_id(model["model"])
+        model_info = model_infos.get(model["model"])
         if model_info:
             if user.id == model_info.user_id or has_access(
                 user.id, type="read", access_control=model_info.access_control
@@ -1676,9 +1701,9 @@ async def download_model(
     url_idx: Optional[int] = None,
     user=Depends(get_admin_user),
 ):
-    allowed_hosts = ["https://huggingface.co/", "https://github.com/"]
+    allowed_hosts = ("https://huggingface.co/", "https://github.com/")
 
-    if not any(form_data.url.startswith(host) for host in allowed_hosts):
+    if not form_data.url.startswith(allowed_hosts):
         raise HTTPException(
             status_code=400,
             detail="Invalid file_url. Only URLs from allowed hosts are permitted.",
@@ -21,6 +21,7 @@ from open_webui.config import (
     CACHE_DIR,
 )
 from open_webui.env import (
+    AIOHTTP_CLIENT_CONNECTION_LIMIT,
     AIOHTTP_CLIENT_SESSION_SSL,
     AIOHTTP_CLIENT_TIMEOUT,
     AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST,
@@ -48,6 +49,12 @@ from open_webui.utils.access_control import has_access
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["OPENAI"])
 
+SPEECH_CACHE_DIR = CACHE_DIR / "audio" / "speech"
+SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Chat completions share one session so connections to the providers are kept alive
+chat_completion_session: Optional[aiohttp.ClientSession] = None
+
 
 ##########################################
 #
@@ -56,28 +63,33 @@ log.setLevel(SRC_LOG_LEVELS["OPENAI"])
 ##########################################
 
 
-async def send_get_request(url, key=None, user: UserModel = None):
-    timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST)
-    try:
+async def send_get_request(
+    url, key=None, user: UserModel = None, session: aiohttp.ClientSession = None
+):
+    if session is None:
+        timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST)
         async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
-            async with session.get(
-                url,
-                headers={
-                    **({"Authorization": f"Bearer {key}"} if key else {}),
-                    **(
-                        {
-                            "X-OpenWebUI-User-Name": user.name,
-                            "X-OpenWebUI-User-Id": user.id,
-                            "X-OpenWebUI-User-Email": user.email,
-                            "X-OpenWebUI-User-Role": user.role,
-                        }
-                        if ENABLE_FORWARD_USER_INFO_HEADERS and user
-                        else {}
-                    ),
-                },
-                ssl=AIOHTTP_CLIENT_SESSION_SSL,
-            ) as response:
-                return await response.json()
+            return await send_get_request(url, key, user=user, session=session)
+
+    try:
+        async with session.get(
+            url,
+            headers={
+                **({"Authorization": f"Bearer {key}"} if key else {}),
+                **(
+                    {
+                        "X-OpenWebUI-User-Name": user.name,
+                        "X-OpenWebUI-User-Id": user.id,
+                        "X-OpenWebUI-User-Email": user.email,
+                        "X-OpenWebUI-User-Role": user.role,
+                    }
+                    if ENABLE_FORWARD_USER_INFO_HEADERS and user
+                    else {}
+                ),
+            },
+            ssl=AIOHTTP_CLIENT_SESSION_SSL,
+        ) as response:
+            return await response.json()
     except Exception as e:
         # Handle connection error here
         log.error(f"Connection error: {e}")
@@ -89,11 +101,32 @@ async def cleanup_response(
     session: Optional[aiohttp.ClientSession],
 ):
     if response:
-        response.close()
+        # Returns the connection to the pool if the body was fully read
+        response.release()
     if session:
         await session.close()
 
 
+def get_chat_completion_session() -> aiohttp.ClientSession:
+    global chat_completion_session
+    if chat_completion_session is None or chat_completion_session.closed:
+        chat_completion_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=AIOHTTP_CLIENT_CONNECTION_LIMIT, ttl_dns_cache=300
+            ),
+            trust_env=True,
+            timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT),
+        )
+    return chat_completion_session
+
+
+async def close_chat_completion_session():
+    global chat_completion_session
+    if chat_completion_session is not None:
+        await chat_completion_session.close()
+        chat_completion_session = None
+
+
 def openai_o_series_handler(payload):
     """
     Handle "o" series specific parameters
@@ -196,8 +229,6 @@ async def speech(request: Request, user=Depends(get_verified_user)):
         body = await request.body()
         name = hashlib.sha256(body).hexdigest()
 
-        SPEECH_CACHE_DIR = CACHE_DIR / "audio" / "speech"
-        SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         file_path = SPEECH_CACHE_DIR.joinpath(f"{name}.mp3")
         file_body_path = SPEECH_CACHE_DIR.joinpath(f"{name}.json")
 
@@ -244,8 +275,8 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                 for chunk in r.iter_content(chunk_size=8192):
                     f.write(chunk)
 
-            with open(file_body_path, "w") as f:
-                json.dump(json.loads(body.decode("utf-8")), f)
+            # The request body is already JSON; store the bytes that were hashed
+            file_body_path.write_bytes(body)
 
             # Return the saved file
             return FileResponse(file_path)
@@ -288,6 +319,12 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
         else:
             request.app.state.config.OPENAI_API_KEYS += [""] * (num_urls - num_keys)
 
+    # Share one session across the fan-out instead of opening one per URL
+    session = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST),
+        trust_env=True,
+    )
+
     request_tasks = []
     for idx, url in enumerate(request.app.state.config.OPENAI_API_BASE_URLS):
         if (str(idx) not in request.app.state.config.OPENAI_API_CONFIGS) and (
@@ -298,6 +335,7 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
                     f"{url}/models",
                     request.app.state.config.OPENAI_API_KEYS[idx],
                     user=user,
+                    session=session,
                 )
             )
         else:
@@ -318,6 +356,7 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
                             f"{url}/models",
                             request.app.state.config.OPENAI_API_KEYS[idx],
                             user=user,
+                            session=session,
                         )
                     )
                 else:
@@ -341,7 +380,10 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
             else:
                 request_tasks.append(asyncio.ensure_future(asyncio.sleep(0, None)))
 
-    responses = await asyncio.gather(*request_tasks)
+    try:
+        responses = await asyncio.gather(*request_tasks)
+    finally:
+        await session.close()
 
     for idx, response in enumerate(responses):
         if response:
@@ -375,9 +417,16 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
 
 async def get_filtered_models(models, user):
     # Filter models based on user access control
+    model_infos = {
+        model_info.id: model_info
+        for model_info in Models.get_models_by_ids(
+            [model["id"] for model in models.get("data", [])]
+        )
+    }
+
     filtered_models = []
     for model in models.get("data", []):
-        model_info = Models.get_model_by_id(model["id"])
+        model_info = model_infos.get(model["id"])
         if model_info:
             if user.id == model_info.user_id or has_access(
                 user.id, type="read", access_control=model_info.access_control
@@ -829,14 +878,11 @@ async def generate_chat_completion(
     payload = json.dumps(payload)
 
     r = None
-    session = None
     streaming = False
     response = None
 
     try:
-        session = aiohttp.ClientSession(
-            trust_env=True, timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
-        )
+        session = get_chat_completion_session()
 
         r = await session.request(
             method="POST",
@@ -853,9 +899,7 @@ async def generate_chat_completion(
                 r.content,
                 status_code=r.status,
                 headers=dict(r.headers),
-                background=BackgroundTask(
-                    cleanup_response, response=r, session=session
-                ),
+                background=BackgroundTask(cleanup_response, response=r, session=None),
             )
         else:
             try:
@@ -881,10 +925,8 @@ async def generate_chat_completion(
             detail=detail if detail else "Open WebUI: Server Connection Error",
         )
     finally:
-        if not streaming and session:
-            if r:
-                r.close()
-            await session.close()
+        if not streaming and r:
+            r.release()
 
 
 async def embeddings(request: Request, form_data: dict, user):
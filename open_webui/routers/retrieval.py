@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import mimetypes
@@ -11,6 +12,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Iterator, List, Optional, Sequence, Union
 
+from aiocache import cached
 from fastapi import (
     Depends,
     FastAPI,
@@ -398,6 +400,7 @@ async def get_rag_config(request: Request, user=Depends(get_admin_user)):
         # Content extraction settings
         "CONTENT_EXTRACTION_ENGINE": request.app.state.config.CONTENT_EXTRACTION_ENGINE,
         "PDF_EXTRACT_IMAGES": request.app.state.config.PDF_EXTRACT_IMAGES,
+        "PDF_LOADER": request.app.state.config.PDF_LOADER,
         "DATALAB_MARKER_API_KEY": request.app.state.config.DATALAB_MARKER_API_KEY,
         "DATALAB_MARKER_LANGS": request.app.state.config.DATALAB_MARKER_LANGS,
         "DATALAB_MARKER_SKIP_CACHE": request.app.state.config.DATALAB_MARKER_SKIP_CACHE,
@@ -561,6 +564,7 @@ class ConfigForm(BaseModel):
     # Content extraction settings
     CONTENT_EXTRACTION_ENGINE: Optional[str] = None
     PDF_EXTRACT_IMAGES: Optional[bool] = None
+    PDF_LOADER: Optional[str] = None
     DATALAB_MARKER_API_KEY: Optional[str] = None
     DATALAB_MARKER_LANGS: Optional[str] = None
     DATALAB_MARKER_SKIP_CACHE: Optional[bool] = None
@@ -672,6 +676,11 @@ async def update_rag_config(
         if form_data.PDF_EXTRACT_IMAGES is not None
         else request.app.state.config.PDF_EXTRACT_IMAGES
     )
+    request.app.state.config.PDF_LOADER = (
+        form_data.PDF_LOADER
+        if form_data.PDF_LOADER is not None
+        else request.app.state.config.PDF_LOADER
+    )
     request.app.state.config.DATALAB_MARKER_API_KEY = (
         form_data.DATALAB_MARKER_API_KEY
         if form_data.DATALAB_MARKER_API_KEY is not None
@@ -991,6 +1000,7 @@ async def update_rag_config(
         # Content extraction settings
         "CONTENT_EXTRACTION_ENGINE": request.app.state.config.CONTENT_EXTRACTION_ENGINE,
         "PDF_EXTRACT_IMAGES": request.app.state.config.PDF_EXTRACT_IMAGES,
+        "PDF_LOADER": request.app.state.config.PDF_LOADER,
         "DATALAB_MARKER_API_KEY": request.app.state.config.DATALAB_MARKER_API_KEY,
         "DATALAB_MARKER_LANGS": request.app.state.config.DATALAB_MARKER_LANGS,
         "DATALAB_MARKER_SKIP_CACHE": request.app.state.config.DATALAB_MARKER_SKIP_CACHE,
@@ -1365,6 +1375,7 @@ def process_file(
                         "picture_description_api": request.app.state.config.DOCLING_PICTURE_DESCRIPTION_API,
                     },
                     PDF_EXTRACT_IMAGES=request.app.state.config.PDF_EXTRACT_IMAGES,
+                    PDF_LOADER=request.app.state.config.PDF_LOADER,
                     DOCUMENT_INTELLIGENCE_ENDPOINT=request.app.state.config.DOCUMENT_INTELLIGENCE_ENDPOINT,
                     DOCUMENT_INTELLIGENCE_KEY=request.app.state.config.DOCUMENT_INTELLIGENCE_KEY,
                     MISTRAL_OCR_API_KEY=request.app.state.config.MISTRAL_OCR_API_KEY,
@@ -1825,6 +1836,34 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
         raise Exception("No search engine API key found in environment variables")
 
 
+def web_search_cache_key(func, request: Request, engine: str, query: str) -> str:
+    # Fold every web search setting (API keys, endpoints, engine options) into
+    # the key so a config change never serves results from the old settings
+    config = request.app.state.config
+    settings = json.dumps(
+        {key: getattr(config, key, None) for key in WebConfig.model_fields},
+        sort_keys=True,
+        default=str,
+    )
+    return ":".join(
+        [
+            func.__name__,
+            engine,
+            hashlib.sha256(settings.encode()).hexdigest(),
+            query,
+        ]
+    )
+
+
+# Identical queries are common while a prompt is refined; reuse their results
+# briefly instead of calling the search engine again
+@cached(ttl=60, key_builder=web_search_cache_key)
+async def search_web_cached(
+    request: Request, engine: str, query: str
+) -> list[SearchResult]:
+    return await run_in_threadpool(search_web, request, engine, query)
+
+
 @router.post("/process/web/search")
 async def process_web_search(
     request: Request, form_data: SearchForm, user=Depends(get_verified_user)
@@ -1837,8 +1876,7 @@ async def process_web_search(
         )
 
         search_tasks = [
-            run_in_threadpool(
-                search_web,
+            search_web_cached(
                 request,
                 request.app.state.config.WEB_SEARCH_ENGINE,
                 query,
@@ -2103,15 +2141,17 @@ def reset_upload_dir(user=Depends(get_admin_user)) -> bool:
         # Check if the directory exists
         if os.path.exists(folder):
             # Iterate over all the files and directories in the specified directory
-            for filename in os.listdir(folder):
-                file_path = os.path.join(folder, filename)
-                try:
-                    if os.path.isfile(file_path) or os.path.islink(file_path):
-                        os.unlink(file_path)  # Remove the file or link
-                    elif os.path.isdir(file_path):
-                        shutil.rmtree(file_path)  # Remove the directory
-                except Exception as e:
-                    log.exception(f"Failed to delete {file_path}. Reason: {e}")
+            # scandir reuses the listing's entry types instead of a stat per path
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    file_path = entry.path
+                    try:
+                        if entry.is_file() or entry.is_symlink():
+                            os.unlink(file_path)  # Remove the file or link
+                        elif entry.is_dir():
+                            shutil.rmtree(file_path)  # Remove the directory
+                    except Exception as e:
+                        log.exception(f"Failed to delete {file_path}. Reason: {e}")
         else:
             log.warning(f"The directory {folder} does not exist")
     except Exception as e:
@@ -2203,10 +2243,11 @@ def process_files_batch(
             )
 
             # Update all files with collection name
+            Files.update_file_metadata_by_ids(
+                [result.file_id for result in results],
+                {"collection_name": collection_name},
+            )
             for result in results:
-                Files.update_file_metadata_by_id(
-                    result.file_id, {"collection_name": collection_name}
-                )
                 result.status = "completed"
 
         except Exception as e:
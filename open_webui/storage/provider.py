@@ -6,9 +6,6 @@ import re
 from abc import ABC, abstractmethod
 from typing import BinaryIO, Tuple, Dict
 
-import boto3
-from botocore.config import Config
-from botocore.exceptions import ClientError
 from open_webui.config import (
     S3_ACCESS_KEY_ID,
     S3_BUCKET_NAME,
@@ -27,12 +24,7 @@ from open_webui.config import (
     STORAGE_PROVIDER,
     UPLOAD_DIR,
 )
-from google.cloud import storage
-from google.cloud.exceptions import GoogleCloudError, NotFound
 from open_webui.constants import ERROR_MESSAGES
-from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
-from azure.core.exceptions import ResourceNotFoundError
 from open_webui.env import SRC_LOG_LEVELS
 
 
@@ -92,21 +84,28 @@ class LocalStorageProvider(StorageProvider):
     def delete_all_files() -> None:
         """Handles deletion of all files from local storage."""
         if os.path.exists(UPLOAD_DIR):
-            for filename in os.listdir(UPLOAD_DIR):
-                file_path = os.path.join(UPLOAD_DIR, filename)
-                try:
-                    if os.path.isfile(file_path) or os.path.islink(file_path):
-                        os.unlink(file_path)  # Remove the file or link
-                    elif os.path.isdir(file_path):
-                        shutil.rmtree(file_path)  # Remove the directory
-                except Exception as e:
-                    log.exception(f"Failed to delete {file_path}. Reason: {e}")
+            # scandir reuses the listing's entry types instead of a stat per path
+            with os.scandir(UPLOAD_DIR) as entries:
+                for entry in entries:
+                    file_path = entry.path
+                    try:
+                        if entry.is_file() or entry.is_symlink():
+                            os.unlink(file_path)  # Remove the file or link
+                        elif entry.is_dir():
+                            shutil.rmtree(file_path)  # Remove the directory
+                    except Exception as e:
+                        log.exception(f"Failed to delete {file_path}. Reason: {e}")
         else:
             log.warning(f"Directory {UPLOAD_DIR} not found in local storage.")
 
 
 class S3StorageProvider(StorageProvider):
     def __init__(self):
+        # Cloud SDKs are imported by the provider that uses them, so only the
+        # configured backend's SDK is loaded at startup
+        import boto3
+        from botocore.config import Config
+
         config = Config(
             s3={
                 "use_accelerate_endpoint": S3_USE_ACCELERATE_ENDPOINT,
@@ -146,6 +145,8 @@ class S3StorageProvider(StorageProvider):
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
     ) -> Tuple[bytes, str]:
         """Handles uploading of the file to S3 storage."""
+        from botocore.exceptions import ClientError
+
         _, file_path = LocalStorageProvider.upload_file(file, filename, tags)
         s3_key = os.path.join(self.key_prefix, filename)
         try:
@@ -174,6 +175,8 @@ class S3StorageProvider(StorageProvider):
 
     def get_file(self, file_path: str) -> str:
         """Handles downloading of the file from S3 storage."""
+        from botocore.exceptions import ClientError
+
         try:
             s3_key = self._extract_s3_key(file_path)
             local_file_path = self._get_local_file_path(s3_key)
@@ -184,6 +187,8 @@ class S3StorageProvider(StorageProvider):
 
     def delete_file(self, file_path: str) -> None:
         """Handles deletion of the file from S3 storage."""
+        from botocore.exceptions import ClientError
+
         try:
             s3_key = self._extract_s3_key(file_path)
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
@@ -195,6 +200,8 @@ class S3StorageProvider(StorageProvider):
 
     def delete_all_files(self) -> None:
         """Handles deletion of all files from S3 storage."""
+        from botocore.exceptions import ClientError
+
         try:
             response = self.s3_client.list_objects_v2(Bucket=self.bucket_name)
             if "Contents" in response:
@@ -222,6 +229,8 @@ class S3StorageProvider(StorageProvider):
 
 class GCSStorageProvider(StorageProvider):
     def __init__(self):
+        from google.cloud import storage
+
         self.bucket_name = GCS_BUCKET_NAME
 
         if GOOGLE_APPLICATION_CREDENTIALS_JSON:
@@ -239,6 +248,8 @@ class GCSStorageProvider(StorageProvider):
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
     ) -> Tuple[bytes, str]:
         """Handles uploading of the file to GCS storage."""
+        from google.cloud.exceptions import GoogleCloudError
+
         contents, file_path = LocalStorageProvider.upload_file(file, filename, tags)
         try:
             blob = self.bucket.blob(filename)
@@ -249,6 +260,8 @@ class GCSStorageProvider(StorageProvider):
 
     def get_file(self, file_path: str) -> str:
         """Handles downloading of the file from GCS storage."""
+        from google.cloud.exceptions import NotFound
+
         try:
             filename = file_path.removeprefix("gs://").split("/")[1]
             local_file_path = f"{UPLOAD_DIR}/{filename}"
@@ -261,6 +274,8 @@ class GCSStorageProvider(StorageProvider):
 
     def delete_file(self, file_path: str) -> None:
         """Handles deletion of the file from GCS storage."""
+        from google.cloud.exceptions import NotFound
+
         try:
             filename = file_path.removeprefix("gs://").split("/")[1]
             blob = self.bucket.get_blob(filename)
@@ -273,6 +288,8 @@ class GCSStorageProvider(StorageProvider):
 
     def delete_all_files(self) -> None:
         """Handles deletion of all files from GCS storage."""
+        from google.cloud.exceptions import NotFound
+
         try:
             blobs = self.bucket.list_blobs()
 
@@ -288,6 +305,9 @@ class GCSStorageProvider(StorageProvider):
 
 class AzureStorageProvider(StorageProvider):
     def __init__(self):
+        from azure.identity import DefaultAzureCredential
+        from azure.storage.blob import BlobServiceClient
+
         self.endpoint = AZURE_STORAGE_ENDPOINT
         self.container_name = AZURE_STORAGE_CONTAINER_NAME
         storage_key = AZURE_STORAGE_KEY
@@ -321,6 +341,8 @@ class AzureStorageProvider(StorageProvider):
 
     def get_file(self, file_path: str) -> str:
         """Handles downloading of the file from Azure Blob Storage."""
+        from azure.core.exceptions import ResourceNotFoundError
+
         try:
             filename = file_path.split("/")[-1]
             local_file_path = f"{UPLOAD_DIR}/{filename}"
@@ -333,6 +355,8 @@ class AzureStorageProvider(StorageProvider):
 
     def delete_file(self, file_path: str) -> None:
         """Handles deletion of the file from Azure Blob Storage."""
+        from azure.core.exceptions import ResourceNotFoundError
+
         try:
             filename = file_path.split("/")[-1]
             blob_client = self.container_client.get_blob_client(filename)
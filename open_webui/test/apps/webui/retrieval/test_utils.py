@@ -0,0 +1,19 @@
+import math
+
+from open_webui.retrieval.utils import get_top_k_indices
+
+
+def test_get_top_k_indices():
+    assert list(get_top_k_indices([0.1, 0.9, 0.5, 0.7], 2)) == [1, 3]
+    assert list(get_top_k_indices([0.1, 0.9, 0.5], 5)) == [1, 2, 0]
+    assert list(get_top_k_indices([0.1, 0.9], 0)) == []
+    assert list(get_top_k_indices([], 3)) == []
+
+
+def test_get_top_k_indices_keeps_tie_order():
+    assert list(get_top_k_indices([0.5, 0.8, 0.5, 0.5], 3)) == [1, 0, 2]
+
+
+def test_get_top_k_indices_with_nan():
+    assert list(get_top_k_indices([math.nan, 0.5, 0.2], 2)) == [1, 2]
+    assert list(get_top_k_indices([math.nan, 0.5, math.nan], 3)) == [1, 0, 2]
@@ -115,15 +115,19 @@ def has_access(
     if access_control is None:
         return type == "read"
 
-    user_groups = Groups.get_groups_by_member_id(user_id)
-    user_group_ids = [group.id for group in user_groups]
     permission_access = access_control.get(type, {})
     permitted_group_ids = permission_access.get("group_ids", [])
     permitted_user_ids = permission_access.get("user_ids", [])
 
-    return user_id in permitted_user_ids or any(
-        group_id in permitted_group_ids for group_id in user_group_ids
-    )
+    # Only look up the user's groups when direct access does not already decide it
+    if user_id in permitted_user_ids:
+        return True
+    if not permitted_group_ids:
+        return False
+
+    user_groups = Groups.get_groups_by_member_id(user_id)
+    permitted_group_ids = set(permitted_group_ids)
+    return any(group.id in permitted_group_ids for group in user_groups)
 
 
 # Get all users with access to a resource
@@ -28,12 +28,14 @@ from open_webui.env import AUDIT_LOG_LEVEL, MAX_BODY_LOG_SIZE
 from open_webui.utils.auth import get_current_user, get_http_authorization_cred
 from open_webui.models.users import UserModel
 
+PASSWORD_FIELD_PATTERN = re.compile(r'"password":\s*"(.*?)"')
+
 
 if TYPE_CHECKING:
     from loguru import Logger
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditLogEntry:
     # `Metadata` audit level properties
     id: str
@@ -99,6 +101,8 @@ class AuditContext:
     metadata (Dict[str, Any]): A dictionary to store additional audit metadata (user, http verb, user agent, etc.).
     """
 
+    __slots__ = ("request_body", "response_body", "max_body_size", "metadata")
+
     def __init__(self, max_body_size: int = MAX_BODY_LOG_SIZE):
         self.request_body = bytearray()
         self.response_body = bytearray()
@@ -124,6 +128,11 @@ class AuditLoggingMiddleware:
     """
 
     AUDITED_METHODS = {"PUT", "PATCH", "DELETE", "POST"}
+    ALWAYS_LOG_ENDPOINTS = (
+        "/api/v1/auths/signin",
+        "/api/v1/auths/signout",
+        "/api/v1/auths/signup",
+    )
 
     def __init__(
         self,
@@ -136,6 +145,10 @@ class AuditLoggingMiddleware:
         self.app = app
         self.audit_logger = AuditLogger(logger)
         self.excluded_paths = excluded_paths or []
+        # match either /api/<resource>/...(for the endpoint /api/chat case) or /api/v1/<resource>/...
+        self.excluded_paths_pattern = re.compile(
+            r"^/api(?:/v1)?/(" + "|".join(self.excluded_paths) + r")\b"
+        )
         self.max_body_size = max_body_size
         self.audit_level = audit_level
 
@@ -204,31 +217,17 @@ class AuditLoggingMiddleware:
         return None
 
     def _should_skip_auditing(self, request: Request) -> bool:
-        if (
-            request.method not in {"POST", "PUT", "PATCH", "DELETE"}
-            or AUDIT_LOG_LEVEL == "NONE"
-        ):
+        if request.method not in self.AUDITED_METHODS or AUDIT_LOG_LEVEL == "NONE":
             return True
 
-        ALWAYS_LOG_ENDPOINTS = {
-            "/api/v1/auths/signin",
-            "/api/v1/auths/signout",
-            "/api/v1/auths/signup",
-        }
-        path = request.url.path.lower()
-        for endpoint in ALWAYS_LOG_ENDPOINTS:
-            if path.startswith(endpoint):
-                return False  # Do NOT skip logging for auth endpoints
+        if request.url.path.lower().startswith(self.ALWAYS_LOG_ENDPOINTS):
+            return False  # Do NOT skip logging for auth endpoints
 
         # Skip logging if the request is not authenticated
         if not request.headers.get("authorization"):
             return True
 
-        # match either /api/<resource>/...(for the endpoint /api/chat case) or /api/v1/<resource>/...
-        pattern = re.compile(
-            r"^/api(?:/v1)?/(" + "|".join(self.excluded_paths) + r")\b"
-        )
-        if pattern.match(request.url.path):
+        if self.excluded_paths_pattern.match(request.url.path):
             return True
 
         return False
@@ -259,10 +258,8 @@ class AuditLoggingMiddleware:
 
             # Redact sensitive information
             if "password" in request_body:
-                request_body = re.sub(
-                    r'"password":\s*"(.*?)"',
-                    '"password": "********"',
-                    request_body,
+                request_body = PASSWORD_FIELD_PATTERN.sub(
+                    '"password": "********"', request_body
                 )
 
             entry = AuditLogEntry(
@@ -6,6 +6,7 @@ import hmac
 import hashlib
 import requests
 import os
+from functools import lru_cache
 
 
 from datetime import datetime, timedelta
@@ -146,6 +147,17 @@ def create_api_key():
     return f"sk-{key}"
 
 
+@lru_cache(maxsize=512)
+def is_api_key_endpoint_allowed(allowed_endpoints: str, path: str) -> bool:
+    allowed_paths = {endpoint.strip() for endpoint in allowed_endpoints.split(",")}
+
+    # Check if the request path, or any parent of it ending at a "/",
+    # is an allowed endpoint.
+    path_prefixes = {path[:idx] for idx, char in enumerate(path) if char == "/"}
+    path_prefixes.add(path)
+    return not allowed_paths.isdisjoint(path_prefixes)
+
+
 def get_http_authorization_cred(auth_header: Optional[str]):
     if not auth_header:
         return None
@@ -181,18 +193,9 @@ def get_current_user(
             )
 
         if request.app.state.config.ENABLE_API_KEY_ENDPOINT_RESTRICTIONS:
-            allowed_paths = [
-                path.strip()
-                for path in str(
-                    request.app.state.config.API_KEY_ALLOWED_ENDPOINTS
-                ).split(",")
-            ]
-
-            # Check if the request path matches any allowed endpoint.
-            if not any(
-                request.url.path == allowed
-                or request.url.path.startswith(allowed + "/")
-                for allowed in allowed_paths
+            if not is_api_key_endpoint_allowed(
+                str(request.app.state.config.API_KEY_ALLOWED_ENDPOINTS),
+                request.url.path,
             ):
                 raise HTTPException(
                     status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.API_KEY_NOT_ALLOWED
@@ -24,20 +24,22 @@ def get_function_module(request, function_id, load_from_db=True):
 
 def get_sorted_filter_ids(request, model: dict, enabled_filter_ids: list = None):
     def get_priority(function_id):
-        function = Functions.get_function_by_id(function_id)
-        if function is not None:
-            valves = Functions.get_function_valves_by_id(function_id)
-            return valves.get("priority", 0) if valves else 0
-        return 0
+        # Only active filters are sorted, so the function is known to exist
+        valves = Functions.get_function_valves_by_id(function_id)
+        return valves.get("priority", 0) if valves else 0
 
-    filter_ids = [function.id for function in Functions.get_global_filter_functions()]
+    # Global filters are a subset of the active ones, so one query covers both
+    active_filter_functions = Functions.get_functions_by_type(
+        "filter", active_only=True
+    )
+
+    filter_ids = [
+        function.id for function in active_filter_functions if function.is_global
+    ]
     if "info" in model and "meta" in model["info"]:
         filter_ids.extend(model["info"]["meta"].get("filterIds", []))
         filter_ids = list(set(filter_ids))
-    active_filter_ids = [
-        function.id
-        for function in Functions.get_functions_by_type("filter", active_only=True)
-    ]
+    active_filter_ids = {function.id for function in active_filter_functions}
 
     def get_active_status(filter_id):
         function_module = get_function_module(request, filter_id)
@@ -47,11 +49,10 @@ def get_sorted_filter_ids(request, model: dict, enabled_filter_ids: list = None)
 
         return True
 
-    active_filter_ids = [
-        filter_id for filter_id in active_filter_ids if get_active_status(filter_id)
+    # Modules are only loaded for the filters this model can actually use
+    filter_ids = [
+        fid for fid in filter_ids if fid in active_filter_ids and get_active_status(fid)
     ]
-
-    filter_ids = [fid for fid in filter_ids if fid in active_filter_ids]
     filter_ids.sort(key=get_priority)
 
     return filter_ids
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from loguru import logger
 
 from open_webui.env import (
+    AUDIT_LOG_FILE_BUFFER_SIZE,
     AUDIT_LOG_FILE_ROTATION_SIZE,
     AUDIT_LOG_LEVEL,
     AUDIT_LOGS_FILE_PATH,
@@ -114,6 +115,8 @@ def start_logger():
 
     if AUDIT_LOG_LEVEL != "NONE":
         try:
+            # Write from a background thread and coalesce entries into larger
+            # writes; loguru flushes the buffer when the sink is removed at exit.
             logger.add(
                 AUDIT_LOGS_FILE_PATH,
                 level="INFO",
@@ -121,6 +124,8 @@ def start_logger():
                 compression="zip",
                 format=file_format,
                 filter=lambda record: record["extra"].get("auditable") is True,
+                enqueue=True,
+                buffering=AUDIT_LOG_FILE_BUFFER_SIZE,
             )
         except Exception as e:
             logger.error(f"Failed to initialize audit log file handler: {str(e)}")
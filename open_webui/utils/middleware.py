@@ -6,6 +6,8 @@ import base64
 
 import asyncio
 from aiocache import cached
+from collections import deque
+from functools import lru_cache
 from typing import Any, Optional
 import random
 import json
@@ -74,6 +76,8 @@ from open_webui.utils.misc import (
     get_last_assistant_message,
     prepend_to_first_user_message_content,
     convert_logit_bias_input_to_json,
+    dumps_indented,
+    loads_json,
 )
 from open_webui.utils.tools import get_tools
 from open_webui.utils.plugin import load_function_module_by_id
@@ -103,6 +107,54 @@ logging.basicConfig(stream=sys.stdout, level=GLOBAL_LOG_LEVEL)
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
+REASONING_TAGS = (
+    ("think", "/think"),
+    ("thinking", "/thinking"),
+    ("reason", "/reason"),
+    ("reasoning", "/reasoning"),
+    ("thought", "/thought"),
+    ("Thought", "/Thought"),
+    ("|begin_of_thought|", "|end_of_thought|"),
+)
+
+CODE_INTERPRETER_TAGS = (("code_interpreter", "/code_interpreter"),)
+
+SOLUTION_TAGS = (("|begin_of_solution|", "|end_of_solution|"),)
+
+TAG_ATTRIBUTES_PATTERN = re.compile(r'(\w+)\s*=\s*"([^"]+)"')
+
+# Details blocks and markdown images, stripped from messages sent to task models
+DETAILS_AND_IMAGES_PATTERN = re.compile(
+    r"<details\b[^>]*>.*?<\/details>|!\[.*?\]\(.*?\)", flags=re.S | re.I
+)
+
+
+@lru_cache(maxsize=None)
+def get_start_tags_pattern(tags: tuple) -> tuple[re.Pattern, dict[str, str]]:
+    """Compile one pattern matching any of the start tags, plus each one's end tag."""
+    alternatives = "|".join(re.escape(start_tag) for start_tag, _ in tags)
+    return (
+        # Start tag e.g., <tag> or <tag attr="value">
+        re.compile(rf"<({alternatives})(\s.*?)?>"),
+        dict(tags),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_tag_patterns(
+    start_tag: str, end_tag: str
+) -> tuple[re.Pattern, re.Pattern, re.Pattern]:
+    """Compile the streaming tag patterns once per (start_tag, end_tag) pair."""
+    start, end = re.escape(start_tag), re.escape(end_tag)
+    return (
+        # Start tag including any attributes
+        re.compile(rf"<{start}(.*?)>"),
+        # End tag e.g., </tag>
+        re.compile(rf"<{end}>", re.DOTALL),
+        # A whole block from its start tag through its end tag
+        re.compile(rf"<{start}(.*?)>.*?<{end}>", re.DOTALL),
+    )
+
 
 async def chat_completion_tools_handler(
     request: Request, body: dict, extra_params: dict, user: UserModel, models, tools
@@ -237,7 +289,7 @@ async def chat_completion_tools_handler(
                             tool_result.remove(item)
 
                 if isinstance(tool_result, dict) or isinstance(tool_result, list):
-                    tool_result = json.dumps(tool_result, indent=2)
+                    tool_result = dumps_indented(tool_result)
 
                 if isinstance(tool_result, str):
                     tool = tools[tool_function_name]
@@ -294,7 +346,7 @@ async def chat_completion_tools_handler(
         log.debug(f"Error: {e}")
         content = None
 
-    log.debug(f"tool_contexts: {sources}")
+    log.debug("tool_contexts: %s", sources)
 
     if skip_files and "files" in body.get("metadata", {}):
         del body["metadata"]["files"]
@@ -664,7 +716,7 @@ async def chat_completion_files_handler(
         except Exception as e:
             log.exception(e)
 
-        log.debug(f"rag_contexts:sources: {sources}")
+        log.debug("rag_contexts:sources: %s", sources)
 
     return body, {"sources": sources}
 
@@ -719,7 +771,7 @@ def apply_params_to_form_data(form_data, model):
 
 async def process_chat_payload(request, form_data, user, metadata, model):
     form_data = apply_params_to_form_data(form_data, model)
-    log.debug(f"form_data: {form_data}")
+    log.debug("form_data: %s", form_data)
 
     event_emitter = get_event_emitter(metadata)
     event_call = get_event_call(metadata)
@@ -1006,6 +1058,10 @@ async def process_chat_response(
     request, response, form_data, user, metadata, model, events, tasks
 ):
     async def background_tasks_handler():
+        # The message history is only loaded and cleaned up for the tasks
+        if not tasks:
+            return
+
         message_map = Chats.get_messages_by_chat_id(metadata["chat_id"])
         message = message_map.get(metadata["message_id"]) if message_map else None
 
@@ -1017,6 +1073,7 @@ async def process_chat_response(
             # the original messages outside of this handler
 
             messages = []
+            strip_details_and_images = DETAILS_AND_IMAGES_PATTERN.sub
             for message in message_list:
                 content = message.get("content", "")
                 if isinstance(content, list):
@@ -1026,12 +1083,9 @@ async def process_chat_response(
                             break
 
                 if isinstance(content, str):
-                    content = re.sub(
-                        r"<details\b[^>]*>.*?<\/details>|!\[.*?\]\(.*?\)",
-                        "",
-                        content,
-                        flags=re.S | re.I,
-                    ).strip()
+                    if "<" in content or "![" in content:
+                        content = strip_details_and_images("", content)
+                    content = content.strip()
 
                 messages.append(
                     {
@@ -1370,12 +1424,22 @@ async def process_chat_response(
                     if block["type"] == "text":
                         content = f"{content}{block['content'].strip()}\n"
                     elif block["type"] == "tool_calls":
+                        if raw:
+                            # Raw content never includes tool calls
+                            continue
+
                         attributes = block.get("attributes", {})
 
                         tool_calls = block.get("content", [])
                         results = block.get("results", [])
 
                         if results:
+                            # Executed tool calls no longer change, so their markup with
+                            # the JSON encoded results is built once, not on every delta
+                            tool_calls_display_content = block.get("display_content")
+                            if tool_calls_display_content is not None:
+                                content = f"{content}\n{tool_calls_display_content}\n\n"
+                                continue
 
                             tool_calls_display_content = ""
                             for tool_call in tool_calls:
@@ -1401,8 +1465,8 @@ async def process_chat_response(
                                 else:
                                     tool_calls_display_content = f'{tool_calls_display_content}\n<details type="tool_calls" done="false" id="{tool_call_id}" name="{tool_name}" arguments="{html.escape(json.dumps(tool_arguments))}">\n<summary>Executing...</summary>\n</details>'
 
-                            if not raw:
-                                content = f"{content}\n{tool_calls_display_content}\n\n"
+                            block["display_content"] = tool_calls_display_content
+                            content = f"{content}\n{tool_calls_display_content}\n\n"
                         else:
                             tool_calls_display_content = ""
 
@@ -1417,8 +1481,7 @@ async def process_chat_response(
 
                                 tool_calls_display_content = f'{tool_calls_display_content}\n<details type="tool_calls" done="false" id="{tool_call_id}" name="{tool_name}" arguments="{html.escape(json.dumps(tool_arguments))}">\n<summary>Executing...</summary>\n</details>'
 
-                            if not raw:
-                                content = f"{content}\n{tool_calls_display_content}\n\n"
+                            content = f"{content}\n{tool_calls_display_content}\n\n"
 
                     elif block["type"] == "reasoning":
                         reasoning_display_content = "\n".join(
@@ -1525,80 +1588,75 @@ async def process_chat_response(
                     if not tag_content:  # Ensure tag_content is not None
                         return attributes
                     # Match attributes in the format: key="value" (ignores single quotes for simplicity)
-                    matches = re.findall(r'(\w+)\s*=\s*"([^"]+)"', tag_content)
+                    matches = TAG_ATTRIBUTES_PATTERN.findall(tag_content)
                     for key, value in matches:
                         attributes[key] = value
                     return attributes
 
                 if content_blocks[-1]["type"] == "text":
-                    for start_tag, end_tag in tags:
-                        # Match start tag e.g., <tag> or <tag attr="value">
-                        start_tag_pattern = rf"<{re.escape(start_tag)}(\s.*?)?>"
-                        match = re.search(start_tag_pattern, content)
-                        if match:
-                            attr_content = (
-                                match.group(1) if match.group(1) else ""
-                            )  # Ensure it's not None
-                            attributes = extract_attributes(
-                                attr_content
-                            )  # Extract attributes safely
-
-                            # Capture everything before and after the matched tag
-                            before_tag = content[
-                                : match.start()
-                            ]  # Content before opening tag
-                            after_tag = content[
-                                match.end() :
-                            ]  # Content after opening tag
-
-                            # Remove the start tag and after from the currently handling text block
-                            content_blocks[-1]["content"] = content_blocks[-1][
-                                "content"
-                            ].replace(match.group(0) + after_tag, "")
-
-                            if before_tag:
-                                content_blocks[-1]["content"] = before_tag
+                    # A single pass over the chunk finds whichever start tag comes first;
+                    # a plain substring test rules out most chunks before the regex runs
+                    start_tags_regex, end_tags = get_start_tags_pattern(tags)
+                    match = start_tags_regex.search(content) if "<" in content else None
+                    if match:
+                        start_tag = match.group(1)
+                        end_tag = end_tags[start_tag]
+                        attr_content = (
+                            match.group(2) if match.group(2) else ""
+                        )  # Ensure it's not None
+                        attributes = extract_attributes(
+                            attr_content
+                        )  # Extract attributes safely
+
+                        # Capture everything before and after the matched tag
+                        before_tag = content[
+                            : match.start()
+                        ]  # Content before opening tag
+                        after_tag = content[match.end() :]  # Content after opening tag
+
+                        # Remove the start tag and after from the currently handling text block
+                        content_blocks[-1]["content"] = content_blocks[-1][
+                            "content"
+                        ].replace(match.group(0) + after_tag, "")
+
+                        if before_tag:
+                            content_blocks[-1]["content"] = before_tag
+
+                        if not content_blocks[-1]["content"]:
+                            content_blocks.pop()
 
-                            if not content_blocks[-1]["content"]:
-                                content_blocks.pop()
+                        # Append the new block
+                        content_blocks.append(
+                            {
+                                "type": content_type,
+                                "start_tag": start_tag,
+                                "end_tag": end_tag,
+                                "attributes": attributes,
+                                "content": "",
+                                "started_at": time.time(),
+                            }
+                        )
 
-                            # Append the new block
-                            content_blocks.append(
-                                {
-                                    "type": content_type,
-                                    "start_tag": start_tag,
-                                    "end_tag": end_tag,
-                                    "attributes": attributes,
-                                    "content": "",
-                                    "started_at": time.time(),
-                                }
+                        if after_tag:
+                            content_blocks[-1]["content"] = after_tag
+                            tag_content_handler(
+                                content_type, tags, after_tag, content_blocks
                             )
-
-                            if after_tag:
-                                content_blocks[-1]["content"] = after_tag
-                                tag_content_handler(
-                                    content_type, tags, after_tag, content_blocks
-                                )
-
-                            break
                 elif content_blocks[-1]["type"] == content_type:
                     start_tag = content_blocks[-1]["start_tag"]
                     end_tag = content_blocks[-1]["end_tag"]
-                    # Match end tag e.g., </tag>
-                    end_tag_pattern = rf"<{re.escape(end_tag)}>"
+                    start_tag_regex, end_tag_regex, block_regex = get_tag_patterns(
+                        start_tag, end_tag
+                    )
 
                     # Check if the content has the end tag
-                    if re.search(end_tag_pattern, content):
+                    if end_tag in content and end_tag_regex.search(content):
                         end_flag = True
 
                         block_content = content_blocks[-1]["content"]
                         # Strip start and end tags from the content
-                        start_tag_pattern = rf"<{re.escape(start_tag)}(.*?)>"
-                        block_content = re.sub(
-                            start_tag_pattern, "", block_content
-                        ).strip()
+                        block_content = start_tag_regex.sub("", block_content).strip()
 
-                        end_tag_regex = re.compile(end_tag_pattern, re.DOTALL)
                         split_content = end_tag_regex.split(block_content, maxsplit=1)
 
                         # Content inside the tag
@@ -1657,12 +1715,7 @@ async def process_chat_response(
                                 )
 
                         # Clean processed content
-                        content = re.sub(
-                            rf"<{re.escape(start_tag)}(.*?)>(.|\n)*?<{re.escape(end_tag)}>",
-                            "",
-                            content,
-                            flags=re.DOTALL,
-                        )
+                        content = block_regex.sub("", content)
 
                 return content, content_blocks, end_flag
 
@@ -1670,7 +1723,8 @@ async def process_chat_response(
                 metadata["chat_id"], metadata["message_id"]
             )
 
-            tool_calls = []
+            # Tool call rounds are consumed in order as the model issues them
+            tool_calls = deque()
 
             last_assistant_message = None
             try:
@@ -1701,20 +1755,6 @@ async def process_chat_response(
                 "code_interpreter", False
             )
 
-            reasoning_tags = [
-                ("think", "/think"),
-                ("thinking", "/thinking"),
-                ("reason", "/reason"),
-                ("reasoning", "/reasoning"),
-                ("thought", "/thought"),
-                ("Thought", "/Thought"),
-                ("|begin_of_thought|", "|end_of_thought|"),
-            ]
-
-            code_interpreter_tags = [("code_interpreter", "/code_interpreter")]
-
-            solution_tags = [("|begin_of_solution|", "|end_of_solution|")]
-
             try:
                 for event in events:
                     await event_emitter(
@@ -1755,7 +1795,7 @@ async def process_chat_response(
                         data = data[len("data:") :].strip()
 
                         try:
-                            data = json.loads(data)
+                            data = loads_json(data)
 
                             data, _ = await process_filter_functions(
                                 request=request,
@@ -1939,7 +1979,7 @@ async def process_chat_response(
                                             content, content_blocks, _ = (
                                                 tag_content_handler(
                                                     "reasoning",
-                                                    reasoning_tags,
+                                                    REASONING_TAGS,
                                                     content,
                                                     content_blocks,
                                                 )
@@ -1949,7 +1989,7 @@ async def process_chat_response(
                                             content, content_blocks, end = (
                                                 tag_content_handler(
                                                     "code_interpreter",
-                                                    code_interpreter_tags,
+                                                    CODE_INTERPRETER_TAGS,
                                                     content,
                                                     content_blocks,
                                                 )
@@ -1962,7 +2002,7 @@ async def process_chat_response(
                                             content, content_blocks, _ = (
                                                 tag_content_handler(
                                                     "solution",
-                                                    solution_tags,
+                                                    SOLUTION_TAGS,
                                                     content,
                                                     content_blocks,
                                                 )
@@ -2029,10 +2069,15 @@ async def process_chat_response(
                 MAX_TOOL_CALL_RETRIES = 10
                 tool_call_retries = 0
 
+                # Blocks up to the last executed tool call no longer change, so their
+                # messages are converted once and only newer blocks each round
+                tool_call_messages = []
+                converted_blocks_count = 0
+
                 while len(tool_calls) > 0 and tool_call_retries < MAX_TOOL_CALL_RETRIES:
                     tool_call_retries += 1
 
-                    response_tool_calls = tool_calls.pop(0)
+                    response_tool_calls = tool_calls.popleft()
 
                     content_blocks.append(
                         {
@@ -2052,8 +2097,7 @@ async def process_chat_response(
 
                     tools = metadata.get("tools", {})
 
-                    results = []
-                    for tool_call in response_tool_calls:
+                    async def execute_tool_call(tool_call):
                         tool_call_id = tool_call.get("id", "")
                         tool_name = tool_call.get("function", {}).get("name", "")
 
@@ -2130,22 +2174,36 @@ async def process_chat_response(
                         if isinstance(tool_result, dict) or isinstance(
                             tool_result, list
                         ):
-                            tool_result = json.dumps(tool_result, indent=2)
+                            tool_result = dumps_indented(tool_result)
+
+                        return {
+                            "tool_call_id": tool_call_id,
+                            "content": tool_result,
+                            **(
+                                {"files": tool_result_files}
+                                if tool_result_files
+                                else {}
+                            ),
+                        }
 
-                        results.append(
-                            {
-                                "tool_call_id": tool_call_id,
-                                "content": tool_result,
-                                **(
-                                    {"files": tool_result_files}
-                                    if tool_result_files
-                                    else {}
-                                ),
-                            }
-                        )
+                    # Tool calls of one response are independent, so run them concurrently
+                    # while keeping the results in the order the model requested them
+                    results = await asyncio.gather(
+                        *[
+                            execute_tool_call(tool_call)
+                            for tool_call in response_tool_calls
+                        ]
+                    )
 
                     content_blocks[-1]["results"] = results
 
+                    tool_call_messages.extend(
+                        convert_content_blocks_to_messages(
+                            content_blocks[converted_blocks_count:]
+                        )
+                    )
+                    converted_blocks_count = len(content_blocks)
+
                     content_blocks.append(
                         {
                             "type": "text",
@@ -2171,7 +2229,7 @@ async def process_chat_response(
                                 "tools": form_data["tools"],
                                 "messages": [
                                     *form_data["messages"],
-                                    *convert_content_blocks_to_messages(content_blocks),
+                                    *tool_call_messages,
                                 ],
                             },
                             user,
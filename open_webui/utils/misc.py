@@ -12,6 +12,11 @@ import json
 import collections.abc
 from open_webui.env import SRC_LOG_LEVELS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
@@ -367,37 +372,43 @@ def parse_duration(duration: str) -> Optional[timedelta]:
     return total_duration
 
 
-def parse_ollama_modelfile(model_text):
-    parameters_meta = {
-        "mirostat": int,
-        "mirostat_eta": float,
-        "mirostat_tau": float,
-        "num_ctx": int,
-        "repeat_last_n": int,
-        "repeat_penalty": float,
-        "temperature": float,
-        "seed": int,
-        "tfs_z": float,
-        "num_predict": int,
-        "top_k": int,
-        "top_p": float,
-        "num_keep": int,
-        "typical_p": float,
-        "presence_penalty": float,
-        "frequency_penalty": float,
-        "penalize_newline": bool,
-        "numa": bool,
-        "num_batch": int,
-        "num_gpu": int,
-        "main_gpu": int,
-        "low_vram": bool,
-        "f16_kv": bool,
-        "vocab_only": bool,
-        "use_mmap": bool,
-        "use_mlock": bool,
-        "num_thread": int,
-    }
+OLLAMA_MODELFILE_PARAMETERS = {
+    "mirostat": int,
+    "mirostat_eta": float,
+    "mirostat_tau": float,
+    "num_ctx": int,
+    "repeat_last_n": int,
+    "repeat_penalty": float,
+    "temperature": float,
+    "seed": int,
+    "tfs_z": float,
+    "num_predict": int,
+    "top_k": int,
+    "top_p": float,
+    "num_keep": int,
+    "typical_p": float,
+    "presence_penalty": float,
+    "frequency_penalty": float,
+    "penalize_newline": bool,
+    "numa": bool,
+    "num_batch": int,
+    "num_gpu": int,
+    "main_gpu": int,
+    "low_vram": bool,
+    "f16_kv": bool,
+    "vocab_only": bool,
+    "use_mmap": bool,
+    "use_mlock": bool,
+    "num_thread": int,
+}
+
+# One case-insensitive scan for all parameters, e.g. `PARAMETER num_ctx 4096`
+OLLAMA_MODELFILE_PARAMETER_PATTERN = re.compile(
+    rf"PARAMETER ({'|'.join(OLLAMA_MODELFILE_PARAMETERS)}) (.+)", re.IGNORECASE
+)
+
 
+def parse_ollama_modelfile(model_text):
     data = {"base_model_id": None, "params": {}}
 
     # Parse base model
@@ -419,24 +430,29 @@ def parse_ollama_modelfile(model_text):
     if stops:
         data["params"]["stop"] = stops
 
-    # Parse other parameters from the provided list
-    for param, param_type in parameters_meta.items():
-        param_match = re.search(rf"PARAMETER {param} (.+)", model_text, re.IGNORECASE)
-        if param_match:
-            value = param_match.group(1)
-
-            try:
-                if param_type is int:
-                    value = int(value)
-                elif param_type is float:
-                    value = float(value)
-                elif param_type is bool:
-                    value = value.lower() == "true"
-            except Exception as e:
-                log.exception(f"Failed to parse parameter {param}: {e}")
-                continue
-
-            data["params"][param] = value
+    # Parse other parameters from the provided list, using the first value of each
+    parsed_params = set()
+    for param_match in OLLAMA_MODELFILE_PARAMETER_PATTERN.finditer(model_text):
+        param = param_match.group(1).lower()
+        if param in parsed_params:
+            continue
+        parsed_params.add(param)
+
+        param_type = OLLAMA_MODELFILE_PARAMETERS[param]
+        value = param_match.group(2)
+
+        try:
+            if param_type is int:
+                value = int(value)
+            elif param_type is float:
+                value = float(value)
+            elif param_type is bool:
+                value = value.lower() == "true"
+        except Exception as e:
+            log.exception(f"Failed to parse parameter {param}: {e}")
+            continue
+
+        data["params"][param] = value
 
     # Parse adapter
     adapter_match = re.search(r"ADAPTER (.+)", model_text, re.IGNORECASE)
@@ -478,3 +494,26 @@ def convert_logit_bias_input_to_json(user_input):
         bias = 100 if bias > 100 else -100 if bias < -100 else bias
         logit_bias_json[token] = bias
     return json.dumps(logit_bias_json)
+
+
+def dumps_indented(obj) -> str:
+    # orjson encodes nested dicts/lists several times faster than json
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2)
+
+
+def loads_json(data):
+    # orjson parses large payloads several times faster than json, but rejects
+    # a few inputs json accepts (e.g. NaN), so those fall back to json
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
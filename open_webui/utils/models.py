@@ -118,21 +118,31 @@ async def get_all_models(request, user: UserModel = None):
             ]
         models = models + arena_models
 
+    # Global actions/filters are a subset of the active ones, so a single query per
+    # type serves the global ids, the enabled ids and the per-id lookups below
+    active_action_functions = Functions.get_functions_by_type(
+        "action", active_only=True
+    )
+    active_filter_functions = Functions.get_functions_by_type(
+        "filter", active_only=True
+    )
+    active_functions = {
+        function.id: function
+        for function in active_action_functions + active_filter_functions
+    }
+
     global_action_ids = [
-        function.id for function in Functions.get_global_action_functions()
-    ]
-    enabled_action_ids = [
-        function.id
-        for function in Functions.get_functions_by_type("action", active_only=True)
+        function.id for function in active_action_functions if function.is_global
     ]
+    enabled_action_ids = {function.id for function in active_action_functions}
 
     global_filter_ids = [
-        function.id for function in Functions.get_global_filter_functions()
-    ]
-    enabled_filter_ids = [
-        function.id
-        for function in Functions.get_functions_by_type("filter", active_only=True)
+        function.id for function in active_filter_functions if function.is_global
     ]
+    enabled_filter_ids = {function.id for function in active_filter_functions}
+
+    # Track the listed ids as a set so presets are checked without a list rebuild
+    model_ids = {model["id"] for model in models}
 
     custom_models = Models.get_all_models()
     for custom_model in custom_models:
@@ -165,10 +175,9 @@ async def get_all_models(request, user: UserModel = None):
                         model["filter_ids"] = filter_ids
                     else:
                         models.remove(model)
+                        model_ids.discard(model["id"])
 
-        elif custom_model.is_active and (
-            custom_model.id not in [model["id"] for model in models]
-        ):
+        elif custom_model.is_active and (custom_model.id not in model_ids):
             owned_by = "openai"
             pipe = None
 
@@ -208,6 +217,7 @@ async def get_all_models(request, user: UserModel = None):
                     "filter_ids": filter_ids,
                 }
             )
+            model_ids.add(custom_model.id)
 
     # Process action_ids to get the actions
     def get_action_items_from_module(function, module):
@@ -253,9 +263,19 @@ async def get_all_models(request, user: UserModel = None):
             }
         ]
 
-    def get_function_module_by_id(function_id):
-        function_module, _, _ = get_function_module_from_cache(request, function_id)
-        return function_module
+    # Many models share the same global actions/filters; load each one once
+    function_cache = {}
+
+    def get_function_and_module_by_id(function_id):
+        if function_id not in function_cache:
+            function = active_functions.get(function_id)
+            function_module = None
+            if function is not None:
+                function_module, _, _ = get_function_module_from_cache(
+                    request, function_id
+                )
+            function_cache[function_id] = (function, function_module)
+        return function_cache[function_id]
 
     for model in models:
         action_ids = [
@@ -271,23 +291,20 @@ async def get_all_models(request, user: UserModel = None):
 
         model["actions"] = []
         for action_id in action_ids:
-            action_function = Functions.get_function_by_id(action_id)
+            action_function, function_module = get_function_and_module_by_id(action_id)
             if action_function is None:
                 raise Exception(f"Action not found: {action_id}")
 
-            function_module = get_function_module_by_id(action_id)
             model["actions"].extend(
                 get_action_items_from_module(action_function, function_module)
             )
 
         model["filters"] = []
         for filter_id in filter_ids:
-            filter_function = Functions.get_function_by_id(filter_id)
+            filter_function, function_module = get_function_and_module_by_id(filter_id)
             if filter_function is None:
                 raise Exception(f"Filter not found: {filter_id}")
 
-            function_module = get_function_module_by_id(filter_id)
-
             if getattr(function_module, "toggle", None):
                 model["filters"].extend(
                     get_filter_items_from_module(filter_function, function_module)
@@ -8,6 +8,79 @@ from typing import Callable, Optional
 import json
 
 
+def parse_json(value: str) -> dict:
+    """
+    Parses a JSON string into a dictionary, handling potential JSONDecodeError.
+    """
+    try:
+        return json.loads(value)
+    except Exception as e:
+        return value
+
+
+def parse_stop(value: list[str]) -> list[str]:
+    return [bytes(s, "utf-8").decode("unicode_escape") for s in value]
+
+
+OPEN_WEBUI_PARAMS = {
+    "stream_response": bool,
+    "function_calling": str,
+    "system": str,
+}
+
+OPENAI_PARAM_MAPPINGS = {
+    "temperature": float,
+    "top_p": float,
+    "min_p": float,
+    "max_tokens": int,
+    "frequency_penalty": float,
+    "presence_penalty": float,
+    "reasoning_effort": str,
+    "seed": lambda x: x,
+    "stop": parse_stop,
+    "logit_bias": lambda x: x,
+    "response_format": dict,
+}
+
+# See https://github.com/ollama/ollama/blob/main/docs/api.md#request-8
+OLLAMA_PARAM_MAPPINGS = {
+    "temperature": float,
+    "top_p": float,
+    "seed": lambda x: x,
+    "mirostat": int,
+    "mirostat_eta": float,
+    "mirostat_tau": float,
+    "num_ctx": int,
+    "num_batch": int,
+    "num_keep": int,
+    "num_predict": int,
+    "repeat_last_n": int,
+    "top_k": int,
+    "min_p": float,
+    "typical_p": float,
+    "repeat_penalty": float,
+    "presence_penalty": float,
+    "frequency_penalty": float,
+    "penalize_newline": bool,
+    "stop": parse_stop,
+    "numa": bool,
+    "num_gpu": int,
+    "main_gpu": int,
+    "low_vram": bool,
+    "vocab_only": bool,
+    "use_mmap": bool,
+    "use_mlock": bool,
+    "num_thread": int,
+}
+
+# Parameters Ollama expects at the root of the payload rather than in options
+OLLAMA_ROOT_PARAMS = {
+    "format": parse_json,
+    "keep_alive": parse_json,
+    "think": bool,
+}
+
+
 # inplace function: form_data is modified
 def apply_model_system_prompt_to_body(
     system: Optional[str], form_data: dict, metadata: Optional[dict] = None, user=None
@@ -67,14 +140,8 @@ def remove_open_webui_params(params: dict) -> dict:
     Returns:
         dict: The modified dictionary with OpenWebUI parameters removed.
     """
-    open_webui_params = {
-        "stream_response": bool,
-        "function_calling": str,
-        "system": str,
-    }
-
     for key in list(params.keys()):
-        if key in open_webui_params:
+        if key in OPEN_WEBUI_PARAMS:
             del params[key]
 
     return params
@@ -99,20 +166,7 @@ def apply_model_params_to_body_openai(params: dict, form_data: dict) -> dict:
         # If there are custom parameters, we need to apply them first
         params = deep_update(params, custom_params)
 
-    mappings = {
-        "temperature": float,
-        "top_p": float,
-        "min_p": float,
-        "max_tokens": int,
-        "frequency_penalty": float,
-        "presence_penalty": float,
-        "reasoning_effort": str,
-        "seed": lambda x: x,
-        "stop": lambda x: [bytes(s, "utf-8").decode("unicode_escape") for s in x],
-        "logit_bias": lambda x: x,
-        "response_format": dict,
-    }
-    return apply_model_params_to_body(params, form_data, mappings)
+    return apply_model_params_to_body(params, form_data, OPENAI_PARAM_MAPPINGS)
 
 
 def apply_model_params_to_body_ollama(params: dict, form_data: dict) -> dict:
@@ -144,53 +198,7 @@ def apply_model_params_to_body_ollama(params: dict, form_data: dict) -> dict:
             params[value] = params[key]
             del params[key]
 
-    # See https://github.com/ollama/ollama/blob/main/docs/api.md#request-8
-    mappings = {
-        "temperature": float,
-        "top_p": float,
-        "seed": lambda x: x,
-        "mirostat": int,
-        "mirostat_eta": float,
-        "mirostat_tau": float,
-        "num_ctx": int,
-        "num_batch": int,
-        "num_keep": int,
-        "num_predict": int,
-        "repeat_last_n": int,
-        "top_k": int,
-        "min_p": float,
-        "typical_p": float,
-        "repeat_penalty": float,
-        "presence_penalty": float,
-        "frequency_penalty": float,
-        "penalize_newline": bool,
-        "stop": lambda x: [bytes(s, "utf-8").decode("unicode_escape") for s in x],
-        "numa": bool,
-        "num_gpu": int,
-        "main_gpu": int,
-        "low_vram": bool,
-        "vocab_only": bool,
-        "use_mmap": bool,
-        "use_mlock": bool,
-        "num_thread": int,
-    }
-
-    def parse_json(value: str) -> dict:
-        """
-        Parses a JSON string into a dictionary, handling potential JSONDecodeError.
-        """
-        try:
-            return json.loads(value)
-        except Exception as e:
-            return value
-
-    ollama_root_params = {
-        "format": lambda x: parse_json(x),
-        "keep_alive": lambda x: parse_json(x),
-        "think": bool,
-    }
-
-    for key, value in ollama_root_params.items():
+    for key, value in OLLAMA_ROOT_PARAMS.items():
         if (param := params.get(key, None)) is not None:
             # Copy the parameter to new name then delete it, to prevent Ollama warning of invalid option provided
             form_data[key] = value(param)
@@ -198,7 +206,7 @@ def apply_model_params_to_body_ollama(params: dict, form_data: dict) -> dict:
 
     # Unlike OpenAI, Ollama does not support params directly in the body
     form_data["options"] = apply_model_params_to_body(
-        params, (form_data.get("options", {}) or {}), mappings
+        params, (form_data.get("options", {}) or {}), OLLAMA_PARAM_MAPPINGS
     )
     return form_data
 
@@ -303,23 +311,8 @@ def convert_payload_openai_to_ollama(openai_payload: dict) -> dict:
         ollama_payload["options"] = openai_payload["options"]
         ollama_options = openai_payload["options"]
 
-        def parse_json(value: str) -> dict:
-            """
-            Parses a JSON string into a dictionary, handling potential JSONDecodeError.
-            """
-            try:
-                return json.loads(value)
-            except Exception as e:
-                return value
-
-        ollama_root_params = {
-            "format": lambda x: parse_json(x),
-            "keep_alive": lambda x: parse_json(x),
-            "think": bool,
-        }
-
         # Ollama's options field can contain parameters that should be at the root level.
-        for key, value in ollama_root_params.items():
+        for key, value in OLLAMA_ROOT_PARAMS.items():
             if (param := ollama_options.get(key, None)) is not None:
                 # Copy the parameter to new name then delete it, to prevent Ollama warning of invalid option provided
                 ollama_payload[key] = value(param)
@@ -14,6 +14,8 @@ from open_webui.models.tools import Tools
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
+FRONTMATTER_PATTERN = re.compile(r"^\s*([a-z_]+):\s*(.*)\s*$", re.IGNORECASE)
+
 
 def extract_frontmatter(content):
     """
@@ -22,7 +24,8 @@ def extract_frontmatter(content):
     frontmatter = {}
     frontmatter_started = False
     frontmatter_ended = False
-    frontmatter_pattern = re.compile(r"^\s*([a-z_]+):\s*(.*)\s*$", re.IGNORECASE)
+    # Bound once, as it is called for every frontmatter line
+    match_frontmatter = FRONTMATTER_PATTERN.match
 
     try:
         lines = content.splitlines()
@@ -39,7 +42,7 @@ def extract_frontmatter(content):
                     break
 
             if frontmatter_started and not frontmatter_ended:
-                match = frontmatter_pattern.match(line)
+                match = match_frontmatter(line)
                 if match:
                     key, value = match.groups()
                     frontmatter[key.strip()] = value.strip()
@@ -77,8 +80,10 @@ def load_tool_module_by_id(tool_id, content=None):
 
         content = tool.content
 
-        content = replace_imports(content)
-        Tools.update_tool_by_id(tool_id, {"content": content})
+        new_content = replace_imports(content)
+        if new_content != content:
+            content = new_content
+            Tools.update_tool_by_id(tool_id, {"content": content})
     else:
         frontmatter = extract_frontmatter(content)
         # Install required packages found within the frontmatter
@@ -122,8 +127,10 @@ def load_function_module_by_id(function_id: str, content: str | None = None):
             raise Exception(f"Function not found: {function_id}")
         content = function.content
 
-        content = replace_imports(content)
-        Functions.update_function_by_id(function_id, {"content": content})
+        new_content = replace_imports(content)
+        if new_content != content:
+            content = new_content
+            Functions.update_function_by_id(function_id, {"content": content})
     else:
         frontmatter = extract_frontmatter(content)
         install_frontmatter_requirements(frontmatter.get("requirements", ""))
@@ -38,39 +38,53 @@ def prompt_variables_template(template: str, variables: dict[str, str]) -> str:
     return template
 
 
+PROMPT_TEMPLATE_VARIABLE_PATTERN = re.compile(
+    r"{{(CURRENT_DATE|CURRENT_TIME|CURRENT_DATETIME|CURRENT_WEEKDAY|USER_NAME|USER_LOCATION)}}"
+)
+PROMPT_TEMPLATE_DATE_FORMATS = {
+    "CURRENT_DATE": "%Y-%m-%d",
+    "CURRENT_TIME": "%I:%M:%S %p",
+    "CURRENT_DATETIME": "%Y-%m-%d %I:%M:%S %p",
+    "CURRENT_WEEKDAY": "%A",
+}
+
+# Case-insensitive with the `(?i)` flag
+PROMPT_VARIABLE_PATTERN = re.compile(
+    r"(?i){{prompt}}|{{prompt:start:(\d+)}}|{{prompt:end:(\d+)}}|{{prompt:middletruncate:(\d+)}}"
+)
+RESPONSES_PROMPT_VARIABLE_PATTERN = re.compile(
+    r"{{prompt}}|{{prompt:start:(\d+)}}|{{prompt:end:(\d+)}}|{{prompt:middletruncate:(\d+)}}"
+)
+MESSAGES_VARIABLE_PATTERN = re.compile(
+    r"{{MESSAGES}}|{{MESSAGES:START:(\d+)}}|{{MESSAGES:END:(\d+)}}|{{MESSAGES:MIDDLETRUNCATE:(\d+)}}"
+)
+
+
 def prompt_template(
     template: str, user_name: Optional[str] = None, user_location: Optional[str] = None
 ) -> str:
+    if "{{" not in template:
+        return template
+
     # Get the current date
     current_date = datetime.now()
 
-    # Format the date to YYYY-MM-DD
-    formatted_date = current_date.strftime("%Y-%m-%d")
-    formatted_time = current_date.strftime("%I:%M:%S %p")
-    formatted_weekday = current_date.strftime("%A")
+    values = {
+        # Unknown user details are rendered as "Unknown"
+        "USER_NAME": user_name if user_name else "Unknown",
+        "USER_LOCATION": user_location if user_location else "Unknown",
+    }
 
-    template = template.replace("{{CURRENT_DATE}}", formatted_date)
-    template = template.replace("{{CURRENT_TIME}}", formatted_time)
-    template = template.replace(
-        "{{CURRENT_DATETIME}}", f"{formatted_date} {formatted_time}"
-    )
-    template = template.replace("{{CURRENT_WEEKDAY}}", formatted_weekday)
+    def replacement_function(match):
+        variable = match.group(1)
+        if variable in values:
+            return values[variable]
 
-    if user_name:
-        # Replace {{USER_NAME}} in the template with the user's name
-        template = template.replace("{{USER_NAME}}", user_name)
-    else:
-        # Replace {{USER_NAME}} in the template with "Unknown"
-        template = template.replace("{{USER_NAME}}", "Unknown")
+        # Dates are only formatted for the variables the template uses
+        return current_date.strftime(PROMPT_TEMPLATE_DATE_FORMATS[variable])
 
-    if user_location:
-        # Replace {{USER_LOCATION}} in the template with the current location
-        template = template.replace("{{USER_LOCATION}}", user_location)
-    else:
-        # Replace {{USER_LOCATION}} in the template with "Unknown"
-        template = template.replace("{{USER_LOCATION}}", "Unknown")
-
-    return template
+    # Substitute every variable in a single pass over the template
+    return PROMPT_TEMPLATE_VARIABLE_PATTERN.sub(replacement_function, template)
 
 
 def replace_prompt_variable(template: str, prompt: str) -> str:
@@ -97,9 +111,7 @@ def replace_prompt_variable(template: str, prompt: str) -> str:
             return f"{start}...{end}"
         return ""
 
-    # Updated regex pattern to make it case-insensitive with the `(?i)` flag
-    pattern = r"(?i){{prompt}}|{{prompt:start:(\d+)}}|{{prompt:end:(\d+)}}|{{prompt:middletruncate:(\d+)}}"
-    template = re.sub(pattern, replacement_function, template)
+    template = PROMPT_VARIABLE_PATTERN.sub(replacement_function, template)
     return template
 
 
@@ -136,11 +148,7 @@ def replace_messages_variable(
             return f"{formatted_start}\n{formatted_end}"
         return ""
 
-    template = re.sub(
-        r"{{MESSAGES}}|{{MESSAGES:START:(\d+)}}|{{MESSAGES:END:(\d+)}}|{{MESSAGES:MIDDLETRUNCATE:(\d+)}}",
-        replacement_function,
-        template,
-    )
+    template = MESSAGES_VARIABLE_PATTERN.sub(replacement_function, template)
 
     return template
 
@@ -341,11 +349,7 @@ def moa_response_generation_template(
             return f"{start}...{end}"
         return ""
 
-    template = re.sub(
-        r"{{prompt}}|{{prompt:start:(\d+)}}|{{prompt:end:(\d+)}}|{{prompt:middletruncate:(\d+)}}",
-        replacement_function,
-        template,
-    )
+    template = RESPONSES_PROMPT_VARIABLE_PATTERN.sub(replacement_function, template)
 
     responses = [f'"""{response}"""' for response in responses]
     responses = "\n\n".join(responses)
@@ -4,8 +4,13 @@ import re
 import inspect
 import aiohttp
 import asyncio
+import hashlib
+import time
+import weakref
 import yaml
 
+from collections import OrderedDict
+
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 from typing import (
@@ -35,6 +40,7 @@ from langchain_core.utils.function_calling import (
 
 from open_webui.models.tools import Tools
 from open_webui.models.users import UserModel
+from open_webui.utils.misc import loads_json
 from open_webui.utils.plugin import load_tool_module_by_id
 from open_webui.env import (
     SRC_LOG_LEVELS,
@@ -47,12 +53,39 @@ import copy
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
 
+# Matches `:param name: description` lines in reST docstrings
+DOCSTRING_PARAM_PATTERN = re.compile(r":param (\w+):\s*(.+)")
+DOCSTRING_FIELDS_PATTERN = re.compile(":(param|return)")
+
+
+# Weakly keyed so request-scoped closures (e.g. tool server calls holding the
+# session token) are dropped with the request instead of pinned by the cache
+function_parameter_names_cache = weakref.WeakKeyDictionary()
+
+
+def get_function_parameter_names(function: Callable) -> frozenset[str]:
+    # Keyed by the underlying function, so bound methods of a tool share an entry
+    try:
+        return function_parameter_names_cache[function]
+    except (KeyError, TypeError):
+        pass
+
+    parameter_names = frozenset(inspect.signature(function).parameters)
+    try:
+        function_parameter_names_cache[function] = parameter_names
+    except TypeError:
+        # Not weak-referenceable (e.g. some builtins); skip caching
+        pass
+    return parameter_names
+
 
 def get_async_tool_function_and_apply_extra_params(
     function: Callable, extra_params: dict
 ) -> Callable[..., Awaitable]:
-    sig = inspect.signature(function)
-    extra_params = {k: v for k, v in extra_params.items() if k in sig.parameters}
+    parameter_names = get_function_parameter_names(
+        getattr(function, "__func__", function)
+    )
+    extra_params = {k: v for k, v in extra_params.items() if k in parameter_names}
     partial_func = partial(function, **extra_params)
 
     if inspect.iscoroutinefunction(function):
@@ -179,7 +212,7 @@ def get_tools(
 
                 # TODO: Support Pydantic models as parameters
                 if callable.__doc__ and callable.__doc__.strip() != "":
-                    s = re.split(":(param|return)", callable.__doc__, 1)
+                    s = DOCSTRING_FIELDS_PATTERN.split(callable.__doc__, 1)
                     spec["description"] = s[0]
                 else:
                     spec["description"] = function_name
@@ -226,7 +259,7 @@ def parse_description(docstring: str | None) -> str:
     description_lines: list[str] = []
 
     for line in lines:
-        if re.match(r":param", line) or re.match(r":return", line):
+        if line.startswith((":param", ":return")):
             break
 
         description_lines.append(line)
@@ -247,12 +280,11 @@ def parse_docstring(docstring):
     if not docstring:
         return {}
 
-    # Regex to match `:param name: description` format
-    param_pattern = re.compile(r":param (\w+):\s*(.+)")
     param_descriptions = {}
+    match_param = DOCSTRING_PARAM_PATTERN.match
 
     for line in docstring.splitlines():
-        match = param_pattern.match(line.strip())
+        match = match_param(line.strip())
         if not match:
             continue
         param_name, param_description = match.groups()
@@ -483,6 +515,27 @@ async def get_tool_server_data(token: str, url: str) -> Dict[str, Any]:
     return data
 
 
+def get_openapi_operations(
+    openapi_spec: Dict[str, Any],
+) -> Dict[str, Tuple[str, str, Dict[str, Any]]]:
+    """
+    Index the operations of an OpenAPI spec by their operationId.
+
+    Returns:
+        dict: operationId -> (route path, lowercased http method, operation).
+    """
+    operations = {}
+    for route_path, methods in openapi_spec.get("paths", {}).items():
+        for http_method, operation in methods.items():
+            if isinstance(operation, dict) and operation.get("operationId"):
+                # The first route declaring an operationId wins
+                operations.setdefault(
+                    operation["operationId"],
+                    (route_path, http_method.lower(), operation),
+                )
+    return operations
+
+
 async def get_tool_servers_data(
     servers: List[Dict[str, Any]], session_token: Optional[str] = None
 ) -> List[Dict[str, Any]]:
@@ -544,44 +597,47 @@ async def get_tool_servers_data(
                 "openapi": openapi_data,
                 "info": response.get("info"),
                 "specs": response.get("specs"),
+                # Looked up on every tool call, so indexed once per fetch
+                "operations": get_openapi_operations(openapi_data),
             }
         )
 
     return results
 
 
+# Results of GET operations that opt in with `x-openwebui-cache-ttl` (seconds),
+# keyed by (server url, token hash, request url) in least recently used order
+TOOL_SERVER_RESPONSE_CACHE_MAX_SIZE = 256
+tool_server_response_cache: OrderedDict = OrderedDict()
+
+
+def get_operation_cache_ttl(operation: Dict[str, Any]) -> Optional[float]:
+    try:
+        cache_ttl = float(operation.get("x-openwebui-cache-ttl") or 0)
+    except (TypeError, ValueError):
+        return None
+    return cache_ttl if cache_ttl > 0 else None
+
+
+def invalidate_tool_server_response_cache(server_url: str):
+    for key in [key for key in tool_server_response_cache if key[0] == server_url]:
+        del tool_server_response_cache[key]
+
+
 async def execute_tool_server(
     token: str, url: str, name: str, params: Dict[str, Any], server_data: Dict[str, Any]
 ) -> Any:
     error = None
     try:
-        openapi = server_data.get("openapi", {})
-        paths = openapi.get("paths", {})
-
-        matching_route = None
-        for route_path, methods in paths.items():
-            for http_method, operation in methods.items():
-                if isinstance(operation, dict) and operation.get("operationId") == name:
-                    matching_route = (route_path, methods)
-                    break
-            if matching_route:
-                break
-
-        if not matching_route:
-            raise Exception(f"No matching route found for operationId: {name}")
-
-        route_path, methods = matching_route
+        operations = server_data.get("operations")
+        if operations is None:
+            operations = get_openapi_operations(server_data.get("openapi", {}))
 
-        method_entry = None
-        for http_method, operation in methods.items():
-            if operation.get("operationId") == name:
-                method_entry = (http_method.lower(), operation)
-                break
-
-        if not method_entry:
-            raise Exception(f"No matching method found for operationId: {name}")
+        operation_entry = operations.get(name)
+        if not operation_entry:
+            raise Exception(f"No matching route found for operationId: {name}")
 
-        http_method, operation = method_entry
+        route_path, http_method, operation = operation_entry
 
         path_params = {}
         query_params = {}
@@ -612,35 +668,68 @@ async def execute_tool_server(
                     f"Request body expected for operation '{name}' but none found."
                 )
 
+        cache_key = None
+        cache_ttl = get_operation_cache_ttl(operation) if http_method == "get" else None
+        if cache_ttl:
+            cache_key = (
+                url,
+                hashlib.sha256((token or "").encode()).hexdigest(),
+                final_url,
+            )
+            cached_entry = tool_server_response_cache.get(cache_key)
+            if cached_entry and cached_entry[0] > time.monotonic():
+                tool_server_response_cache.move_to_end(cache_key)
+                # Copied, as the caller may modify the result (e.g. to extract files)
+                return copy.deepcopy(cached_entry[1])
+
         headers = {"Content-Type": "application/json"}
 
         if token:
             headers["Authorization"] = f"Bearer {token}"
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            request_method = getattr(session, http_method.lower())
-
-            if http_method in ["post", "put", "patch"]:
-                async with request_method(
-                    final_url,
-                    json=body_params,
-                    headers=headers,
-                    ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
-                ) as response:
-                    if response.status >= 400:
-                        text = await response.text()
-                        raise Exception(f"HTTP error {response.status}: {text}")
-                    return await response.json()
-            else:
-                async with request_method(
-                    final_url,
-                    headers=headers,
-                    ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
-                ) as response:
-                    if response.status >= 400:
-                        text = await response.text()
-                        raise Exception(f"HTTP error {response.status}: {text}")
-                    return await response.json()
+        try:
+            async with aiohttp.ClientSession(trust_env=True) as session:
+                request_method = getattr(session, http_method.lower())
+
+                if http_method in ["post", "put", "patch"]:
+                    async with request_method(
+                        final_url,
+                        json=body_params,
+                        headers=headers,
+                        ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
+                    ) as response:
+                        if response.status >= 400:
+                            text = await response.text()
+                            raise Exception(f"HTTP error {response.status}: {text}")
+                        return await response.json(loads=loads_json)
+                else:
+                    async with request_method(
+                        final_url,
+                        headers=headers,
+                        ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
+                    ) as response:
+                        if response.status >= 400:
+                            text = await response.text()
+                            raise Exception(f"HTTP error {response.status}: {text}")
+                        result = await response.json(loads=loads_json)
+
+                        if cache_key is not None:
+                            tool_server_response_cache[cache_key] = (
+                                time.monotonic() + cache_ttl,
+                                copy.deepcopy(result),
+                            )
+                            tool_server_response_cache.move_to_end(cache_key)
+                            while (
+                                len(tool_server_response_cache)
+                                > TOOL_SERVER_RESPONSE_CACHE_MAX_SIZE
+                            ):
+                                tool_server_response_cache.popitem(last=False)
+
+                        return result
+        finally:
+            if http_method != "get":
+                # Writes (even failed ones) may change what cached reads would return
+                invalidate_tool_server_response_cache(url)
 
     except Exception as err:
         error = str(err)